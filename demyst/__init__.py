@@ -41,103 +41,51 @@ __author__ = "Demyst Team"
 __description__ = "The Scientific Integrity Platform for AI Research"
 
 # Lazy imports to avoid circular dependencies
-from typing import Any
+import importlib
+from typing import Any, Dict, Tuple
 
-
-def __getattr__(name: str) -> Any:
-    """Lazy loading of components to avoid import errors when dependencies aren't installed."""
+# Submodule -> public names it provides, resolved on first attribute access
+_LAZY_MODULES: Dict[str, Tuple[str, ...]] = {
     # Core Engine
-    if name in ["MirageDetector"]:
-        from demyst.engine.mirage_detector import MirageDetector
-
-        return MirageDetector
-    elif name in ["VariationTensor"]:
-        from demyst.engine.variation_tensor import VariationTensor
-
-        return VariationTensor
-    elif name in ["Transpiler"]:
-        from demyst.engine.transpiler import Transpiler
-
-        return Transpiler
-    elif name in ["CSTTranspiler"]:
-        from demyst.engine.cst_transformer import CSTTranspiler
-
-        return CSTTranspiler
-    elif name in ["ParallelAnalyzer"]:
-        from demyst.engine.parallel import ParallelAnalyzer
-
-        return ParallelAnalyzer
-
+    "demyst.engine.mirage_detector": ("MirageDetector",),
+    "demyst.engine.variation_tensor": ("VariationTensor",),
+    "demyst.engine.transpiler": ("Transpiler",),
+    "demyst.engine.cst_transformer": ("CSTTranspiler",),
+    "demyst.engine.parallel": ("ParallelAnalyzer",),
     # Guards
-    elif name in [
+    "demyst.guards.tensor_guard": (
         "TensorGuard",
         "GradientDeathDetector",
         "NormalizationAnalyzer",
         "RewardHackingDetector",
-    ]:
-        from demyst.guards import tensor_guard
-
-        return getattr(tensor_guard, name)
-    elif name in ["LeakageHunter", "TaintAnalyzer", "DataFlowTracker"]:
-        from demyst.guards import leakage_hunter
-
-        return getattr(leakage_hunter, name)
-    elif name in ["HypothesisGuard", "BonferroniCorrector", "ExperimentTracker"]:
-        from demyst.guards import hypothesis_guard
-
-        return getattr(hypothesis_guard, name)
-    elif name in ["UnitGuard", "DimensionalAnalyzer", "UnitInferenceEngine", "Dimension"]:
-        from demyst.guards import unit_guard
-
-        return getattr(unit_guard, name)
-
+    ),
+    "demyst.guards.leakage_hunter": ("LeakageHunter", "TaintAnalyzer", "DataFlowTracker"),
+    "demyst.guards.hypothesis_guard": (
+        "HypothesisGuard",
+        "BonferroniCorrector",
+        "ExperimentTracker",
+    ),
+    "demyst.guards.unit_guard": (
+        "UnitGuard",
+        "DimensionalAnalyzer",
+        "UnitInferenceEngine",
+        "Dimension",
+    ),
     # Fixer
-    elif name in ["DemystFixer", "fix_source"]:
-        from demyst import fixer
-
-        return getattr(fixer, name)
-
+    "demyst.fixer": ("DemystFixer", "fix_source"),
     # Integrations
-    elif name in ["CIEnforcer", "ScientificIntegrityReport"]:
-        from demyst.integrations import ci_enforcer
-
-        return getattr(ci_enforcer, name)
-    elif name in ["TorchVariation", "TorchModuleWrapper"]:
-        from demyst.integrations import torch_hooks
-
-        return getattr(torch_hooks, name)
-    elif name in ["JaxVariation", "jax_safe_transform"]:
-        from demyst.integrations import jax_hooks
-
-        return getattr(jax_hooks, name)
-    elif name in ["WandBIntegration", "MLflowIntegration"]:
-        from demyst.integrations import experiment_trackers
-
-        return getattr(experiment_trackers, name)
-
+    "demyst.integrations.ci_enforcer": ("CIEnforcer", "ScientificIntegrityReport"),
+    "demyst.integrations.torch_hooks": ("TorchVariation", "TorchModuleWrapper"),
+    "demyst.integrations.jax_hooks": ("JaxVariation", "jax_safe_transform"),
+    "demyst.integrations.experiment_trackers": ("WandBIntegration", "MLflowIntegration"),
     # Generators
-    elif name in ["PaperGenerator", "MethodologyExtractor"]:
-        from demyst.generators import paper_generator
-
-        return getattr(paper_generator, name)
-    elif name in ["IntegrityReportGenerator"]:
-        from demyst.generators import report_generator
-
-        return getattr(report_generator, name)
-
+    "demyst.generators.paper_generator": ("PaperGenerator", "MethodologyExtractor"),
+    "demyst.generators.report_generator": ("IntegrityReportGenerator",),
     # Configuration
-    elif name in ["DemystConfig", "ConfigManager"]:
-        if name == "ConfigManager":
-            from demyst.config.manager import ConfigManager
-
-            return ConfigManager
-        else:
-            from demyst.config.models import DemystConfig
-
-            return DemystConfig
-
+    "demyst.config.manager": ("ConfigManager",),
+    "demyst.config.models": ("DemystConfig",),
     # Exceptions
-    elif name in [
+    "demyst.exceptions": (
         "DemystError",
         "AnalysisError",
         "ConfigurationError",
@@ -146,30 +94,30 @@ def __getattr__(name: str) -> Any:
         "TranspilerError",
         "FixerError",
         "PluginError",
-    ]:
-        from demyst import exceptions
-
-        return getattr(exceptions, name)
-
+    ),
     # Plugins
-    elif name in ["PluginRegistry", "GuardPlugin", "FixerPlugin", "get_registry"]:
-        from demyst import plugins
-
-        return getattr(plugins, name)
-
+    "demyst.plugins": ("PluginRegistry", "GuardPlugin", "FixerPlugin", "get_registry"),
     # Console
-    elif name in ["DemystConsole", "get_console"]:
-        from demyst import console
-
-        return getattr(console, name)
-
+    "demyst.console": ("DemystConsole", "get_console"),
     # Lazy imports
-    elif name in ["lazy_import", "require"]:
-        from demyst import lazy
+    "demyst.lazy": ("lazy_import", "require"),
+}
+
+_LAZY_ATTRS: Dict[str, str] = {
+    name: module for module, names in _LAZY_MODULES.items() for name in names
+}
 
-        return getattr(lazy, name)
 
-    raise AttributeError(f"module 'demyst' has no attribute '{name}'")
+def __getattr__(name: str) -> Any:
+    """Lazy loading of components to avoid import errors when dependencies aren't installed."""
+    module = _LAZY_ATTRS.get(name)
+    if module is None:
+        raise AttributeError(f"module 'demyst' has no attribute '{name}'")
+
+    value = getattr(importlib.import_module(module), name)
+    # Cache on the package so later lookups bypass __getattr__ entirely
+    globals()[name] = value
+    return value
 
 
 __all__ = [
@@ -0,0 +1,26 @@
+"""
+Optional numba acceleration for numeric kernels.
+
+``jit`` compiles a function with ``numba.njit(cache=True)`` when numba is
+installed and returns it unchanged otherwise, so decorated kernels must be
+written against plain numpy arrays and scalars only.
+"""
+
+from typing import Any, Callable, TypeVar
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+try:
+    from numba import njit as _njit
+
+    NUMBA_AVAILABLE = True
+except ImportError:
+    _njit = None
+    NUMBA_AVAILABLE = False
+
+
+def jit(func: F) -> F:
+    """Compile ``func`` with numba if available, otherwise return it as-is."""
+    if _njit is None:
+        return func
+    return _njit(cache=True)(func)  # type: ignore[no-any-return]
@@ -0,0 +1,29 @@
+"""
+Optional orjson acceleration for JSON reports.
+
+Without orjson, ``dumps`` is ``json.dumps(obj, indent=2, default=str)``.
+With orjson installed the encoding runs in Rust and the output differs:
+
+- non-ASCII text is emitted as UTF-8 instead of ``\\uXXXX`` escapes;
+- NaN and infinities become ``null`` instead of the non-standard
+  ``NaN``/``Infinity`` tokens;
+- numpy arrays and numpy scalars other than float64 are serialized as
+  JSON lists and numbers instead of their ``str()`` text.
+"""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+
+    _OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+except ImportError:
+    orjson = None
+
+
+def dumps(obj: Any) -> str:
+    """Serialize ``obj`` as 2-space indented JSON, stringifying unknown types."""
+    if orjson is None:
+        return json.dumps(obj, indent=2, default=str)
+    return orjson.dumps(obj, default=str, option=_OPTIONS).decode("utf-8")
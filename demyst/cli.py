@@ -20,15 +20,15 @@ Usage:
 """
 
 import argparse
-import json
 import logging
 import os
 import sys
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
+from demyst._json import dumps as json_dumps
 from demyst.console import DemystConsole, format_analysis_report, get_console
-from demyst.utils import safe_read_file
+from demyst.utils import parse_source, safe_read_file
 
 
 def _merge_configs(base: Dict[str, Any], override: Dict[str, Any]) -> Dict[str, Any]:
@@ -203,7 +203,7 @@ def analyze_command(args: argparse.Namespace, config_path: Optional[str] = None)
         if args.format == "markdown":
             print(report.to_markdown())
         elif args.format == "json":
-            print(json.dumps(report.to_dict(), indent=2))
+            print(json_dumps(report.to_dict()))
         else:
             # Use rich console for text output
             console.print_rule(f"Analysis Report: {args.path}")
@@ -212,18 +212,19 @@ def analyze_command(args: argparse.Namespace, config_path: Optional[str] = None)
             if report.total_issues > 0:
                 console.print_warning(f"Found {report.total_issues} issues.")
 
-                for check in report.checks:
-                    if not check.passed:
-                        console.print_rule(check.name)
-                        for issue in check.issues:
-                            # Reconstruct dict for print_violations
-                            violation = {
-                                "type": check.name,
-                                "line": issue.get("line"),
-                                "description": issue.get("description"),
-                                "recommendation": issue.get("recommendation"),
-                            }
-                            console.print_violations([violation], file_path=issue.get("file"))
+                with console.buffered():
+                    for check in report.checks:
+                        if not check.passed:
+                            console.print_rule(check.name)
+                            for issue in check.issues:
+                                # Reconstruct dict for print_violations
+                                violation = {
+                                    "type": check.name,
+                                    "line": issue.get("line"),
+                                    "description": issue.get("description"),
+                                    "recommendation": issue.get("recommendation"),
+                                }
+                                console.print_violations([violation], file_path=issue.get("file"))
             else:
                 console.print_success("No issues detected!")
         return 0 if report.badge_status == "passing" else 1
@@ -236,7 +237,7 @@ def analyze_command(args: argparse.Namespace, config_path: Optional[str] = None)
             return 1
 
         if args.format == "json":
-            print(json.dumps(result, indent=2, default=str))
+            print(json_dumps(result))
         elif args.format == "markdown":
             print(_format_analysis_result_to_markdown(result, args.path))
         else:
@@ -252,8 +253,6 @@ def analyze_command(args: argparse.Namespace, config_path: Optional[str] = None)
 
 def mirage_command(args: argparse.Namespace, config_path: Optional[str] = None) -> int:
     """Detect computational mirages (variance-destroying operations)."""
-    import ast
-
     from demyst.engine.mirage_detector import MirageDetector
 
     console = get_console(force_terminal=args.debug)
@@ -266,13 +265,14 @@ def mirage_command(args: argparse.Namespace, config_path: Optional[str] = None)
         return 1
 
     try:
-        tree = ast.parse(source)
+        tree = parse_source(source, args.path)
     except SyntaxError as e:
         console.print_error(f"Syntax error in {args.path}: {e}")
         return 1
 
     detector = MirageDetector()
-    detector.visit(tree)
+    if MirageDetector.TRIAGE.search(source):
+        detector.visit(tree)
 
     if not detector.mirages:
         console.print_success("No computational mirages detected.")
@@ -425,7 +425,7 @@ def hypothesis_command(args: argparse.Namespace, config_path: Optional[str] = No
     summary = result.get("summary", {})
     console.print_warning(f"\nVerdict: {summary.get('verdict', 'Unknown')}")
 
-    return 1 if any(v["severity"] == "invalid" for v in violations) else 0
+    return 1 if summary.get("invalid_count", 0) > 0 else 0
 
 
 def units_command(args: argparse.Namespace, config_path: Optional[str] = None) -> int:
@@ -453,9 +453,10 @@ def units_command(args: argparse.Namespace, config_path: Optional[str] = None) -
     if not violations:
         console.print_success("No dimensional consistency issues detected.")
         if result.get("inferred_dimensions"):
-            console.print_info("\nInferred dimensions:")
-            for var, dim in result["inferred_dimensions"].items():
-                console.print_info(f"  {var}: {dim}")
+            with console.buffered():
+                console.print_info("\nInferred dimensions:")
+                for var, dim in result["inferred_dimensions"].items():
+                    console.print_info(f"  {var}: {dim}")
         return 0
 
     console.print_rule("Dimensional Analysis Issues")
@@ -464,7 +465,7 @@ def units_command(args: argparse.Namespace, config_path: Optional[str] = None) -
     summary = result.get("summary", {})
     console.print_warning(f"Verdict: {summary.get('verdict', 'Unknown')}")
 
-    return 1 if any(v["severity"] == "critical" for v in violations) else 0
+    return 1 if summary.get("critical_count", 0) > 0 else 0
 
 
 def tensor_command(args: argparse.Namespace, config_path: Optional[str] = None) -> int:
@@ -628,7 +629,7 @@ def report_command(args: argparse.Namespace, config_path: Optional[str] = None)
         try:
             content = safe_read_file(args.path)
             cert = generator.generate_certificate({args.path: content})
-            print(json.dumps(cert, indent=2))
+            print(json_dumps(cert))
             return 0
         except Exception as e:
             console.print_error(f"Failed to generate certificate: {e}")
@@ -683,6 +684,16 @@ def ci_command(args: argparse.Namespace, config_path: Optional[str] = None) -> i
     """Run in CI/CD enforcement mode."""
     from demyst.integrations.ci_enforcer import CIEnforcer
 
+    if getattr(args, "daemon", False):
+        import socket
+
+        if not hasattr(socket, "AF_UNIX"):
+            get_console().print_error("--daemon requires Unix domain sockets")
+            return 1
+        from demyst.integrations.ci_daemon import serve
+
+        return serve(args.socket, config_path=args.config)
+
     console = get_console(force_terminal=args.debug)
     logger.info(f"Running CI enforcement on {args.path}")
 
@@ -787,6 +798,177 @@ def version_command(args: argparse.Namespace, config_path: Optional[str] = None)
     return 0
 
 
+# Subcommand table: (name, help, [(flags, add_argument options), ...], handler)
+_CommandSpec = Tuple[
+    str,
+    str,
+    List[Tuple[Tuple[str, ...], Dict[str, Any]]],
+    Callable[..., int],
+]
+
+_SUBCOMMANDS: List[_CommandSpec] = [
+    (
+        "analyze",
+        "Run all integrity checks",
+        [
+            (("path",), {"help": "File or directory to analyze"}),
+            (
+                ("--format", "-f"),
+                {
+                    "choices": ["markdown", "json", "text"],
+                    "default": "text",
+                    "help": "Output format",
+                },
+            ),
+            (
+                ("--profile", "-p"),
+                {
+                    "choices": [
+                        "physics",
+                        "biology",
+                        "chemistry",
+                        "neuroscience",
+                        "climate",
+                        "economics",
+                    ],
+                    "help": (
+                        "Domain-specific profile "
+                        "(physics enables natural units, 5σ thresholds, etc.)"
+                    ),
+                },
+            ),
+        ],
+        analyze_command,
+    ),
+    (
+        "mirage",
+        "Detect computational mirages",
+        [
+            (("path",), {"help": "File to analyze"}),
+            (
+                ("--fix",),
+                {"action": "store_true", "help": "Auto-fix detected mirages using transpiler"},
+            ),
+            (("--output", "-o"), {"help": "Output file for fixed code"}),
+            (("--diff",), {"action": "store_true", "help": "Show diff of changes"}),
+            (
+                ("--dry-run",),
+                {"action": "store_true", "help": "Show what would be done without making changes"},
+            ),
+        ],
+        mirage_command,
+    ),
+    ("leakage", "Detect data leakage", [(("path",), {"help": "File to analyze"})], leakage_command),
+    (
+        "hypothesis",
+        "Check statistical validity",
+        [(("path",), {"help": "File to analyze"})],
+        hypothesis_command,
+    ),
+    (
+        "units",
+        "Check dimensional consistency",
+        [(("path",), {"help": "File to analyze"})],
+        units_command,
+    ),
+    (
+        "tensor",
+        "Check deep learning integrity",
+        [(("path",), {"help": "File to analyze"})],
+        tensor_command,
+    ),
+    (
+        "report",
+        "Generate integrity report",
+        [
+            (("path",), {"help": "File or directory to analyze"}),
+            (
+                ("--format", "-f"),
+                {
+                    "choices": ["markdown", "html", "json", "text"],
+                    "default": "text",
+                    "help": "Output format",
+                },
+            ),
+            (
+                ("--cert",),
+                {"action": "store_true", "help": "Generate Certificate of Integrity (JSON)"},
+            ),
+        ],
+        report_command,
+    ),
+    (
+        "paper",
+        "Generate LaTeX methodology",
+        [
+            (("path",), {"help": "File to analyze"}),
+            (("--output", "-o"), {"help": "Output file"}),
+            (("--title", "-t"), {"default": "Methodology", "help": "Section title"}),
+            (
+                ("--style", "-s"),
+                {
+                    "choices": ["neurips", "icml", "iclr", "arxiv"],
+                    "default": "neurips",
+                    "help": "Paper style",
+                },
+            ),
+            (("--full",), {"action": "store_true", "help": "Generate full paper template"}),
+        ],
+        paper_command,
+    ),
+    (
+        "ci",
+        "CI/CD enforcement mode",
+        [
+            (("path",), {"nargs": "?", "default": ".", "help": "Directory to analyze"}),
+            (
+                ("--strict",),
+                {"action": "store_true", "help": "Fail on warnings (not just critical issues)"},
+            ),
+            (
+                ("--daemon",),
+                {
+                    "action": "store_true",
+                    "help": "Serve per-file analysis over a Unix socket instead of scanning path",
+                },
+            ),
+            (
+                ("--socket",),
+                {
+                    "default": None,
+                    "help": "Socket path for --daemon (default: a per-user demyst.sock)",
+                },
+            ),
+        ],
+        ci_command,
+    ),
+    (
+        "fix",
+        "Auto-fix issues",
+        [
+            (("path",), {"help": "File or directory to fix"}),
+            (("--dry-run",), {"action": "store_true", "help": "Show what would be done"}),
+            (
+                ("--interactive", "-i"),
+                {"action": "store_true", "help": "Ask before applying fix"},
+            ),
+        ],
+        fix_command,
+    ),
+    (
+        "red-team",
+        "Run adversarial benchmark against Demyst detectors",
+        [
+            (
+                ("--verbose", "-v"),
+                {"action": "store_true", "help": "Show detailed results for each test case"},
+            ),
+        ],
+        red_team_command,
+    ),
+]
+
+
 def main() -> int:
     """Main CLI entry point."""
     parser = argparse.ArgumentParser(
@@ -816,113 +998,18 @@ For more information: https://github.com/demyst/demyst
     # Restore this line
     parser.add_argument("--config", "-c", help="Path to configuration file")
 
-    subparsers = parser.add_subparsers(dest="command", help="Commands")
-
-    # Analyze command
-    analyze_parser = subparsers.add_parser("analyze", help="Run all integrity checks")
-    analyze_parser.add_argument("path", help="File or directory to analyze")
-    analyze_parser.add_argument(
-        "--format", "-f", choices=["markdown", "json", "text"], default="text", help="Output format"
-    )
-    # Removed: analyze_parser.add_argument("--config", "-c", help="Path to configuration file")
-    analyze_parser.add_argument(
-        "--profile",
-        "-p",
-        choices=["physics", "biology", "chemistry", "neuroscience", "climate", "economics"],
-        help="Domain-specific profile (physics enables natural units, 5σ thresholds, etc.)",
-    )
-    analyze_parser.set_defaults(func=analyze_command)
-    mirage_parser = subparsers.add_parser("mirage", help="Detect computational mirages")
-    mirage_parser.add_argument("path", help="File to analyze")
-    mirage_parser.add_argument(
-        "--fix", action="store_true", help="Auto-fix detected mirages using transpiler"
-    )
-    mirage_parser.add_argument("--output", "-o", help="Output file for fixed code")
-    mirage_parser.add_argument("--diff", action="store_true", help="Show diff of changes")
-    mirage_parser.add_argument(
-        "--dry-run", action="store_true", help="Show what would be done without making changes"
-    )
-    mirage_parser.set_defaults(func=mirage_command)
-
-    # Leakage command
-    leakage_parser = subparsers.add_parser("leakage", help="Detect data leakage")
-    leakage_parser.add_argument("path", help="File to analyze")
-    # Removed: leakage_parser.add_argument("--config", "-c", help="Path to configuration file")
-    leakage_parser.set_defaults(func=leakage_command)
-
-    # Hypothesis command
-    hypothesis_parser = subparsers.add_parser("hypothesis", help="Check statistical validity")
-    hypothesis_parser.add_argument("path", help="File to analyze")
-    hypothesis_parser.set_defaults(func=hypothesis_command)
-
-    # Units command
-    units_parser = subparsers.add_parser("units", help="Check dimensional consistency")
-    units_parser.add_argument("path", help="File to analyze")
-    units_parser.set_defaults(func=units_command)
-
-    # Tensor command
-    tensor_parser = subparsers.add_parser("tensor", help="Check deep learning integrity")
-    tensor_parser.add_argument("path", help="File to analyze")
-    tensor_parser.set_defaults(func=tensor_command)
-
-    # Report command
-    report_parser = subparsers.add_parser("report", help="Generate integrity report")
-    report_parser.add_argument("path", help="File or directory to analyze")
-    report_parser.add_argument(
-        "--format",
-        "-f",
-        choices=["markdown", "html", "json", "text"],
-        default="text",
-        help="Output format",
-    )
-    report_parser.add_argument(
-        "--cert", action="store_true", help="Generate Certificate of Integrity (JSON)"
-    )
-    # Removed: report_parser.add_argument("--config", "-c", help="Path to configuration file")
-    report_parser.set_defaults(func=report_command)
-
-    # Paper command
-    paper_parser = subparsers.add_parser("paper", help="Generate LaTeX methodology")
-    paper_parser.add_argument("path", help="File to analyze")
-    paper_parser.add_argument("--output", "-o", help="Output file")
-    paper_parser.add_argument("--title", "-t", default="Methodology", help="Section title")
-    paper_parser.add_argument(
-        "--style",
-        "-s",
-        choices=["neurips", "icml", "iclr", "arxiv"],
-        default="neurips",
-        help="Paper style",
-    )
-    paper_parser.add_argument("--full", action="store_true", help="Generate full paper template")
-    paper_parser.set_defaults(func=paper_command)
-
-    # CI command
-    ci_parser = subparsers.add_parser("ci", help="CI/CD enforcement mode")
-    ci_parser.add_argument("path", nargs="?", default=".", help="Directory to analyze")
-    ci_parser.add_argument(
-        "--strict", action="store_true", help="Fail on warnings (not just critical issues)"
-    )
-    # Removed: ci_parser.add_argument("--config", "-c", help="Path to configuration file")
-
-    ci_parser.set_defaults(func=ci_command)
-
-    # Fix command
-    fix_parser = subparsers.add_parser("fix", help="Auto-fix issues")
-    fix_parser.add_argument("path", help="File or directory to fix")
-    fix_parser.add_argument("--dry-run", action="store_true", help="Show what would be done")
-    fix_parser.add_argument(
-        "--interactive", "-i", action="store_true", help="Ask before applying fix"
-    )
-    fix_parser.set_defaults(func=fix_command)
+    # `demyst --version` never needs the subcommand tree
+    if sys.argv[1:] in (["--version"], ["-v"]):
+        args = parser.parse_args()
+        setup_logging(debug=bool(os.environ.get("DEMYST_DEBUG")))
+        return version_command(args)
 
-    # Red Team command
-    red_team_parser = subparsers.add_parser(
-        "red-team", help="Run adversarial benchmark against Demyst detectors"
-    )
-    red_team_parser.add_argument(
-        "--verbose", "-v", action="store_true", help="Show detailed results for each test case"
-    )
-    red_team_parser.set_defaults(func=red_team_command)
+    subparsers = parser.add_subparsers(dest="command", help="Commands")
+    for name, help_text, arguments, func in _SUBCOMMANDS:
+        subparser = subparsers.add_parser(name, help=help_text)
+        for flags, options in arguments:
+            subparser.add_argument(*flags, **options)
+        subparser.set_defaults(func=func)
 
     args = parser.parse_args()
 
@@ -9,8 +9,9 @@ Falls back gracefully to plain text when Rich is not available.
 
 from __future__ import annotations
 
+import io
 import sys
-from contextlib import contextmanager
+from contextlib import contextmanager, redirect_stdout
 from typing import Any, Dict, Generator, Iterable, List, Optional, Union
 
 # Try to import Rich components
@@ -36,6 +37,13 @@ try:
 except ImportError:
     RICH_AVAILABLE = False
 
+from demyst.utils import load_tree
+
+# Plain-text violation layout (no Rich); one template per output line
+_PLAIN_HEADER = "\n{kind} Line {line}{location}\n"
+_PLAIN_DESCRIPTION = "  {description}\n"
+_PLAIN_CONTEXT = "{marker} {number:4d} | {text}\n"
+_PLAIN_FIX = "  Fix: {recommendation}\n"
 
 # =============================================================================
 # Custom Theme
@@ -222,16 +230,31 @@ class DemystConsole:
             self.print_success("No violations detected.")
             return
 
-        # Read source if not provided
+        # Read source if not provided (memoized, so per-issue calls for the
+        # same file after an analysis run do not re-read it)
         if not source and file_path:
             try:
-                with open(file_path, "r", encoding="utf-8") as f:
-                    source = f.read()
+                source = load_tree(file_path)[0]
             except Exception:
                 pass
 
         source_lines = source.splitlines() if source else []
 
+        with self.buffered():
+            self._print_violation_list(violations, file_path, source_lines, context_lines)
+
+    def _print_violation_list(
+        self,
+        violations: List[Dict[str, Any]],
+        file_path: Optional[str],
+        source_lines: List[str],
+        context_lines: int,
+    ) -> None:
+        """Print each violation; called inside ``buffered()``."""
+        if not self._console:
+            self._write_plain_violations(violations, file_path, source_lines, context_lines)
+            return
+
         for v in violations:
             violation_type = v.get("type", "unknown")
             line = v.get("line", 0)
@@ -240,53 +263,63 @@ class DemystConsole:
 
             # Header
             type_style = self._get_violation_style(violation_type)
-            if self._console:
-                self._console.print()
-                self._console.print(
-                    f"[{type_style}]{violation_type.upper()}[/{type_style}] "
-                    f"[line]Line {line}[/line]"
-                    + (f" in [file]{file_path}[/file]" if file_path else "")
-                )
-            else:
-                print(
-                    f"\n{violation_type.upper()} Line {line}"
-                    + (f" in {file_path}" if file_path else "")
-                )
+            self._console.print()
+            self._console.print(
+                f"[{type_style}]{violation_type.upper()}[/{type_style}] "
+                f"[line]Line {line}[/line]" + (f" in [file]{file_path}[/file]" if file_path else "")
+            )
 
             # Description
             if description:
-                if self._console:
-                    self._console.print(f"  {description}")
-                else:
-                    print(f"  {description}")
+                self._console.print(f"  {description}")
 
             # Code context
             if source_lines and 0 < line <= len(source_lines):
                 start = max(0, line - context_lines - 1)
                 end = min(len(source_lines), line + context_lines)
-                context = "\n".join(source_lines[start:end])
-
-                if self._console:
-                    syntax = Syntax(
-                        context,
-                        "python",
-                        line_numbers=True,
-                        start_line=start + 1,
-                        highlight_lines={line},
-                        theme="monokai",
-                    )
-                    self._console.print(syntax)
-                else:
-                    for i in range(start, end):
-                        marker = ">>>" if i == line - 1 else "   "
-                        print(f"{marker} {i + 1:4d} | {source_lines[i]}")
+                syntax = Syntax(
+                    "\n".join(source_lines[start:end]),
+                    "python",
+                    line_numbers=True,
+                    start_line=start + 1,
+                    highlight_lines={line},
+                    theme="monokai",
+                )
+                self._console.print(syntax)
 
             # Recommendation
             if recommendation:
-                if self._console:
-                    self._console.print(f"  [info]Fix:[/info] {recommendation}")
-                else:
-                    print(f"  Fix: {recommendation}")
+                self._console.print(f"  [info]Fix:[/info] {recommendation}")
+
+    def _write_plain_violations(
+        self,
+        violations: List[Dict[str, Any]],
+        file_path: Optional[str],
+        source_lines: List[str],
+        context_lines: int,
+    ) -> None:
+        """Plain-text counterpart of ``_print_violation_list``, one template per line."""
+        write = sys.stdout.write
+        location = f" in {file_path}" if file_path else ""
+        num_lines = len(source_lines)
+
+        for v in violations:
+            line = v.get("line", 0)
+            kind = str(v.get("type", "unknown")).upper()
+            write(_PLAIN_HEADER.format(kind=kind, line=line, location=location))
+
+            if v.get("description"):
+                write(_PLAIN_DESCRIPTION.format_map(v))
+
+            if source_lines and 0 < line <= num_lines:
+                start = max(0, line - context_lines - 1)
+                end = min(num_lines, line + context_lines)
+                for i in range(start, end):
+                    marker = ">>>" if i == line - 1 else "   "
+                    write(_PLAIN_CONTEXT.format(marker=marker, number=i + 1, text=source_lines[i]))
+
+            if v.get("recommendation"):
+                write(_PLAIN_FIX.format_map(v))
 
     def _get_violation_style(self, violation_type: str) -> str:
         """Get the style for a violation type."""
@@ -349,6 +382,27 @@ class DemystConsole:
             print(f"\n{title}")
             print(diff)
 
+    @contextmanager
+    def buffered(self) -> Generator[None, None, None]:
+        """
+        Collect everything printed inside the block and write it out once.
+
+        Output loops (one violation after another) otherwise pay a stdout
+        write and lock round-trip for every line they print.
+        """
+        if self._console:
+            # Rich consoles buffer renders until the outermost context exits
+            with self._console:
+                yield
+            return
+
+        buffer = io.StringIO()
+        try:
+            with redirect_stdout(buffer):
+                yield
+        finally:
+            sys.stdout.write(buffer.getvalue())
+
     @contextmanager
     def progress(
         self,
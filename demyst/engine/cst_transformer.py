@@ -25,6 +25,7 @@ from demyst.exceptions import (
     TransformationError,
     UnsafeTransformationError,
 )
+from demyst.utils import unified_diff
 
 # =============================================================================
 # Data Classes for Transformations
@@ -614,15 +615,17 @@ class CSTTranspiler:
 
     def get_diff(self, original: Optional[str] = None, transformed: Optional[str] = None) -> str:
         """Generate unified diff between original and transformed code."""
-        import difflib
-
         original = original or self._last_source
         transformed = transformed or self._last_transformed
 
+        # Nothing was transformed: skip splitting and diffing
+        if transformed == original:
+            return ""
+
         original_lines = original.splitlines(keepends=True)
         transformed_lines = transformed.splitlines(keepends=True)
 
-        diff = difflib.unified_diff(
+        diff = unified_diff(
             original_lines,
             transformed_lines,
             fromfile="original",
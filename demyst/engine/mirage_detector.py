@@ -5,6 +5,8 @@ import re
 from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional, Set, Tuple
 
+from demyst.utils import SharedInstanceMixin
+
 # Inline suppression pattern: # demyst: ignore or # demyst: ignore-mirage
 DEMYST_IGNORE_PATTERN = re.compile(r"#\s*demyst:\s*ignore(?:-(\w+))?", re.IGNORECASE)
 
@@ -203,7 +205,7 @@ class VarState:
     dispersion_lines: Set[int] = field(default_factory=set)
 
 
-class MirageDetector(ast.NodeVisitor):
+class MirageDetector(SharedInstanceMixin, ast.NodeVisitor):
     """
     AST visitor that detects destructive operations that collapse physical information.
 
@@ -230,6 +232,16 @@ class MirageDetector(ast.NodeVisitor):
         self._suppressed_lines: Set[int] = set()
         self._source_lines: List[str] = []
 
+    def reset(self) -> None:
+        """Clear accumulated mirages and scope state before a new analysis."""
+        # Rebind rather than clear: earlier analyze() results alias these lists
+        self.mirages = []
+        self.current_function = None
+        self.dispersion_contexts = {}
+        self.var_states = {}
+        self._suppressed_lines = set()
+        self._source_lines = []
+
     def analyze(self, tree: ast.AST, source: Optional[str] = None) -> List[Dict[str, Any]]:
         """
         Analyze an AST tree with optional variance context awareness.
@@ -257,6 +269,44 @@ class MirageDetector(ast.NodeVisitor):
         self.visit(tree)
         return self.mirages
 
+    def analyze_chunks(
+        self, tree: ast.Module, source: Optional[str] = None, chunk_size: int = 500
+    ) -> List[Dict[str, Any]]:
+        """
+        Analyze a module in independent blocks of top-level statements.
+
+        Each block of ``chunk_size`` statements is analyzed with fresh scope
+        state, so the per-block working set stays bounded on very large files.
+        Variable inferences and variance context do not carry across block
+        boundaries; use ``analyze`` when whole-module context matters.
+
+        Args:
+            tree: The module AST to analyze
+            source: Optional source code string for inline suppression detection
+            chunk_size: Number of top-level statements per block
+        """
+        if chunk_size < 1:
+            raise ValueError(f"chunk_size must be positive, got {chunk_size}")
+
+        if source:
+            self._source_lines = source.splitlines()
+            self._collect_suppressions()
+
+        body = tree.body
+        for start in range(0, len(body), chunk_size):
+            chunk = ast.Module(body=body[start : start + chunk_size], type_ignores=[])
+            self.current_function = None
+            self.var_states = {}
+
+            if self.check_variance_context:
+                collector = DispersionContextCollector()
+                collector.visit(chunk)
+                self.dispersion_contexts = collector.dispersion_contexts
+
+            self.visit(chunk)
+
+        return self.mirages
+
     def _collect_suppressions(self) -> None:
         """Scan source lines for # demyst: ignore comments."""
         for i, line in enumerate(self._source_lines, start=1):
@@ -463,6 +513,12 @@ class MirageDetector(ast.NodeVisitor):
         "nanquantile",
     }
 
+    # Every mirage is a call whose name is one of these identifiers, so source
+    # that never mentions any of them cannot produce a finding
+    TRIAGE = re.compile(
+        r"\b(?:%s)\b" % "|".join(sorted(VARIANCE_DESTROYING_OPS | {"round", "int"}))
+    )
+
     def visit_Call(self, node: ast.Call) -> None:
         """Detect variance-destroying reductions on array-like data."""
         if isinstance(node.func, ast.Attribute):
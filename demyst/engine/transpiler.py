@@ -13,10 +13,10 @@ from __future__ import annotations
 
 import argparse
 import ast
-import difflib
-import os
+import io
+import re
 import sys
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Tuple, Union, cast
 
 from demyst.exceptions import (
     DemystError,
@@ -28,9 +28,18 @@ from demyst.exceptions import (
 
 # Try to import LibCST-based transformer, fall back to AST if not available
 try:
-    from demyst.engine.cst_transformer import CSTTranspiler, TransformationRecord
+    from demyst.engine.cst_transformer import (
+        CSTTranspiler,
+        TransformationRecord,
+        TransformationType,
+    )
     from demyst.engine.cst_transformer import detect_mirages as cst_detect_mirages
 
+    # Legacy record "type" for each CST transformation kind, built once
+    _LEGACY_TYPE_NAMES = {
+        t: t.name.lower().replace("_to_variation", "") for t in TransformationType
+    }
+
     CST_AVAILABLE = True
 except ImportError:
     CST_AVAILABLE = False
@@ -39,6 +48,78 @@ except ImportError:
 from demyst.engine.mirage_detector import MirageDetector
 from demyst.engine.variation_tensor import VariationTensor
 from demyst.engine.variation_transformer import VariationTransformer
+from demyst.utils import parse_source, unified_diff
+
+# CLI target spec: "path/to/file.py" or "path/to/file.py:LINE"
+_TARGET_RE = re.compile(r"^(.+?)(?::(\d+))?$")
+
+
+def _read_source(file_path: str) -> str:
+    """Read a source file as UTF-8, falling back to latin-1."""
+    try:
+        with open(file_path, "r", encoding="utf-8") as f:
+            source = f.read()
+    except UnicodeDecodeError:
+        try:
+            with open(file_path, "r", encoding="latin-1") as f:
+                source = f.read()
+        except Exception as e:
+            raise FileReadError(file_path, "Encoding error", e)
+    except FileNotFoundError:
+        raise FileReadError(file_path, "File not found")
+    except PermissionError:
+        raise FileReadError(file_path, "Permission denied")
+    except Exception as e:
+        raise FileReadError(file_path, str(e), e)
+
+    return source
+
+
+_VARIATION_IMPORT = "from demyst.engine.variation_tensor import VariationTensor\n"
+
+# (start_line, start_col, end_line, end_col, replacement); columns are UTF-8 byte offsets
+_SourceEdit = Tuple[int, int, int, int, str]
+
+
+def _splice_source(source: str, edits: List[_SourceEdit]) -> str:
+    """Apply non-overlapping span replacements to ``source``, last span first."""
+    lines = io.StringIO(source, newline="").readlines()
+    for start_line, start_col, end_line, end_col, text in sorted(edits, reverse=True):
+        head = lines[start_line - 1].encode("utf-8")[:start_col]
+        tail = lines[end_line - 1].encode("utf-8")[end_col:]
+        lines[start_line - 1 : end_line] = [(head + text.encode("utf-8") + tail).decode("utf-8")]
+    return "".join(lines)
+
+
+def _import_insert_line(tree: ast.Module) -> int:
+    """Line after the module docstring and leading imports (0 means top of file)."""
+    line = 0
+    for index, stmt in enumerate(tree.body):
+        is_docstring = (
+            index == 0
+            and isinstance(stmt, ast.Expr)
+            and isinstance(stmt.value, ast.Constant)
+            and isinstance(stmt.value.value, str)
+        )
+        if not (is_docstring or isinstance(stmt, (ast.Import, ast.ImportFrom))):
+            if stmt.lineno <= line:
+                # Shares a line with the preceding import; go above that line instead
+                shared = [
+                    s.lineno for s in tree.body[:index] if cast(int, s.end_lineno) >= stmt.lineno
+                ]
+                line = min(shared) - 1
+            break
+        line = cast(int, stmt.end_lineno)
+    return line
+
+
+def _has_variation_import(tree: ast.Module) -> bool:
+    return any(
+        isinstance(stmt, ast.ImportFrom)
+        and stmt.module == "demyst.engine.variation_tensor"
+        and any(alias.name == "VariationTensor" for alias in stmt.names)
+        for stmt in tree.body
+    )
 
 
 class Transpiler:
@@ -54,6 +135,15 @@ class Transpiler:
         use_cst: Whether to use CST-based transformations (default: True if available)
     """
 
+    __slots__ = (
+        "use_cst",
+        "transformations",
+        "_detector",
+        "_cst_transpiler",
+        "_source",
+        "_orig_lines",
+    )
+
     def __init__(self, use_cst: bool = True) -> None:
         """
         Initialize the transpiler.
@@ -65,6 +155,8 @@ class Transpiler:
         self.transformations: List[Dict[str, Any]] = []
         self._detector = MirageDetector()
         self._cst_transpiler: Optional["CSTTranspiler"] = None
+        self._source: Optional[str] = None
+        self._orig_lines: Optional[List[str]] = None
 
         if self.use_cst:
             self._cst_transpiler = CSTTranspiler()
@@ -74,6 +166,13 @@ class Transpiler:
         """Return the transformation backend being used."""
         return "libcst" if self.use_cst else "ast"
 
+    @property
+    def orig_lines(self) -> List[str]:
+        """Lines of the last transpiled source, split on first use."""
+        if self._orig_lines is None:
+            self._orig_lines = (self._source or "").splitlines(keepends=True)
+        return self._orig_lines
+
     def transpile_file(self, file_path: str, target_line: Optional[int] = None) -> str:
         """
         Transpile a Python file to preserve physical information.
@@ -90,22 +189,7 @@ class Transpiler:
             ParseError: If the file contains invalid Python syntax
             TranspilerError: If transformation fails
         """
-        try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                source = f.read()
-        except UnicodeDecodeError:
-            try:
-                with open(file_path, "r", encoding="latin-1") as f:
-                    source = f.read()
-            except Exception as e:
-                raise FileReadError(file_path, "Encoding error", e)
-        except FileNotFoundError:
-            raise FileReadError(file_path, "File not found")
-        except PermissionError:
-            raise FileReadError(file_path, "Permission denied")
-        except Exception as e:
-            raise FileReadError(file_path, str(e), e)
-
+        source = _read_source(file_path)
         return self.transpile_source(source, target_line, file_path=file_path)
 
     def transpile_source(
@@ -127,6 +211,8 @@ class Transpiler:
             TranspilerError: If transformation fails
         """
         self.transformations = []
+        self._source = source
+        self._orig_lines = None
 
         # Use CST-based transformation if available
         if self.use_cst and self._cst_transpiler is not None:
@@ -146,7 +232,7 @@ class Transpiler:
             # Convert CST transformation records to legacy format
             self.transformations = [
                 {
-                    "type": t.type.name.lower().replace("_to_variation", ""),
+                    "type": _LEGACY_TYPE_NAMES[t.type],
                     "line": t.line,
                     "function": t.function_context,
                     "transformation": t.description,
@@ -167,7 +253,7 @@ class Transpiler:
         """Perform AST-based transformation (fallback)."""
         # Parse AST
         try:
-            tree = ast.parse(source)
+            tree = parse_source(source, file_path or "<unknown>")
         except SyntaxError as e:
             raise ParseError(
                 f"Invalid Python syntax: {e.msg}",
@@ -179,7 +265,8 @@ class Transpiler:
 
         # Detect mirages
         self._detector = MirageDetector()
-        self._detector.visit(tree)
+        if MirageDetector.TRIAGE.search(source):
+            self._detector.visit(tree)
 
         # Filter by target line if specified
         mirages = self._detector.mirages
@@ -192,16 +279,40 @@ class Transpiler:
             )
             return source
 
-        # Transform AST
+        # Transform only the outermost mirage calls and splice their new text
+        # into the original source, leaving every other line untouched
         try:
             transformer = VariationTransformer(mirages)
-            new_tree = transformer.visit(tree)
-
-            # Fix line numbers and column offsets
-            ast.fix_missing_locations(new_tree)
-
-            # Generate new source
-            new_source = ast.unparse(new_tree)
+            nested = {
+                id(child)
+                for m in transformer.mirage_nodes.values()
+                for child in ast.walk(m["node"])
+                if child is not m["node"]
+            }
+            edits: List[_SourceEdit] = []
+            for mirage in transformer.mirage_nodes.values():
+                node = mirage["node"]
+                if id(node) in nested:
+                    continue
+                substitutions_before = transformer.substitutions_made
+                new_node = transformer.visit(node)
+                if transformer.substitutions_made == substitutions_before:
+                    continue
+                edits.append(
+                    (
+                        node.lineno,
+                        node.col_offset,
+                        node.end_lineno,
+                        node.end_col_offset,
+                        ast.unparse(new_node),
+                    )
+                )
+
+            if edits and not _has_variation_import(tree):
+                insert_line = _import_insert_line(tree)
+                edits.append((insert_line + 1, 0, insert_line + 1, 0, _VARIATION_IMPORT))
+
+            new_source = _splice_source(source, edits)
         except Exception as e:
             raise TranspilerError(
                 f"AST transformation failed: {e}", file_path=file_path, details={"error": str(e)}
@@ -231,13 +342,19 @@ class Transpiler:
         Returns:
             Unified diff string
         """
-        if self.use_cst and self._cst_transpiler is not None:
-            return self._cst_transpiler.get_diff(original, transformed)
-
-        original_lines = original.splitlines(keepends=True)
+        # Untouched sources (the common no-mirage case) come back as the same
+        # string object, so this is usually an identity check, not a scan
+        if transformed == original:
+            return ""
+
+        # Callers diff the source they just transpiled; reuse its split lines
+        if original is self._source:
+            original_lines = self.orig_lines
+        else:
+            original_lines = original.splitlines(keepends=True)
         transformed_lines = transformed.splitlines(keepends=True)
 
-        diff = difflib.unified_diff(
+        diff = unified_diff(
             original_lines,
             transformed_lines,
             fromfile="original",
@@ -281,20 +398,19 @@ def main() -> int:
 
     args = parser.parse_args()
 
-    # Parse target specification
-    if ":" in args.target:
-        file_path, line_str = args.target.rsplit(":", 1)
-        try:
-            target_line: Optional[int] = int(line_str)
-        except ValueError:
-            print(f"Invalid line number: {line_str}")
-            return 1
-    else:
-        file_path = args.target
-        target_line = None
-
-    if not os.path.exists(file_path):
-        print(f"File not found: {file_path}")
+    # Parse target specification (file or file:line)
+    match = _TARGET_RE.match(args.target)
+    if match is None:
+        print(f"Invalid target: {args.target!r}")
+        return 1
+    file_path, line_str = match.groups()
+    target_line = int(line_str) if line_str else None
+
+    # Reading doubles as the existence check (no separate stat call)
+    try:
+        original_source = _read_source(file_path)
+    except FileReadError as e:
+        print(f"Error: {e}")
         return 1
 
     # Configure backend
@@ -309,23 +425,23 @@ def main() -> int:
     transpiler = Transpiler(use_cst=use_cst)
 
     try:
-        with open(file_path, "r") as f:
-            original_source = f.read()
-
-        transformed_source = transpiler.transpile_file(file_path, target_line)
+        # Hand the text already read to the transpiler instead of re-reading it
+        transformed_source = transpiler.transpile_source(
+            original_source, target_line, file_path=file_path
+        )
 
+        # Collect the report and emit it with a single write
         if args.diff:
-            diff = transpiler.get_diff(original_source, transformed_source)
-            print(diff)
+            report = [transpiler.get_diff(original_source, transformed_source)]
+        elif args.output:
+            with open(args.output, "w") as f:
+                f.write(transformed_source)
+            report = [f"Transformed source written to {args.output}"]
         else:
-            if args.output:
-                with open(args.output, "w") as f:
-                    f.write(transformed_source)
-                print(f"Transformed source written to {args.output}")
-            else:
-                print(transformed_source)
-
-        transpiler.print_summary()
+            report = [transformed_source]
+
+        report.append(transpiler.get_summary())
+        sys.stdout.write("\n".join(report) + "\n")
         return 0
 
     except DemystError as e:
@@ -11,6 +11,8 @@ class VariationTransformer(ast.NodeTransformer):
         self.mirages = mirages
         self.mirage_nodes = {id(m["node"]): m for m in mirages}
         self.imports_added: Set[str] = set()
+        # Number of calls actually rewritten (discretization is left as-is)
+        self.substitutions_made = 0
 
     def visit_Call(self, node: ast.Call) -> Any:
         """Transform destructive calls to VariationTensor equivalents"""
@@ -18,8 +20,10 @@ class VariationTransformer(ast.NodeTransformer):
             mirage = self.mirage_nodes[id(node)]
 
             if mirage["type"] == "mean":
+                self.substitutions_made += 1
                 return self._create_variation_tensor_collapse(node, "mean")
             elif mirage["type"] == "sum":
+                self.substitutions_made += 1
                 return self._create_variation_tensor_ensemble_sum(node)
             elif mirage["type"] == "premature_discretization":
                 return self._create_discretization_wrapper(node)
@@ -16,6 +16,7 @@ from __future__ import annotations
 
 import difflib
 import logging
+import re
 from dataclasses import dataclass, field
 from enum import Enum, auto
 from pathlib import Path
@@ -328,6 +329,17 @@ class DemystFixer:
         backup: If True, create backup files before modifying
     """
 
+    # Auto-fixable violation types and the fix each one receives
+    FIX_TABLE: Dict[str, str] = {
+        "mean": "Transform np.mean to VariationTensor.collapse('mean')",
+        "sum": "Transform np.sum to VariationTensor.ensemble_sum()",
+        "argmax": "Transform np.argmax to VariationTensor.collapse('argmax')",
+        "argmin": "Transform np.argmin to VariationTensor.collapse('argmin')",
+        "premature_discretization": "Wrap discretization in VariationTensor tracking",
+    }
+
+    __slots__ = ("dry_run", "interactive", "backup", "_use_cst")
+
     def __init__(
         self, dry_run: bool = False, interactive: bool = False, backup: bool = True
     ) -> None:
@@ -471,8 +483,7 @@ class DemystFixer:
 
     def _can_fix(self, violation: Dict[str, Any]) -> bool:
         """Determine if a violation is auto-fixable."""
-        fixable_types = {"mean", "sum", "argmax", "argmin", "premature_discretization"}
-        return violation.get("type") in fixable_types
+        return violation.get("type") in self.FIX_TABLE
 
     def _read_file(self, filepath: str) -> str:
         """Read a file with proper encoding handling."""
@@ -503,35 +514,56 @@ class DemystFixer:
         self, source: str, violations: List[Dict[str, Any]]
     ) -> Tuple[str, List[FixAction]]:
         """Apply fixes using text-based approach (fallback)."""
-        lines = source.splitlines(keepends=True)
+        # Offset of the first character of each line; a trailing newline
+        # leaves one past-the-end offset that is not a line
+        starts = [0]
+        starts.extend(m.end() for m in re.finditer("\n", source))
+        if starts[-1] == len(source):
+            starts.pop()
+        starts.append(len(source))
+
         actions: List[FixAction] = []
+        edits: List[Tuple[int, int, str]] = []
+        commented: Set[int] = set()
 
-        # Sort by line number descending to avoid offset issues
+        # Walk violations bottom-up so actions keep their reported order
         sorted_violations = sorted(violations, key=lambda v: v.get("line", 0), reverse=True)
 
         for v in sorted_violations:
             line_idx = v.get("line", 0) - 1
-            if 0 <= line_idx < len(lines):
+            if 0 <= line_idx < len(starts) - 1 and line_idx not in commented:
                 vtype = v.get("type", "unknown")
-                original_line = lines[line_idx]
+                start, end = starts[line_idx], starts[line_idx + 1]
+                original_line = source[start:end]
 
                 # Add TODO comment if not already present
                 if "# TODO: demyst" not in original_line and "# demyst-fix" not in original_line:
                     comment = f"  # TODO: demyst - Use VariationTensor for '{vtype}' to preserve variance\n"
-                    lines[line_idx] = original_line.rstrip("\n") + comment
+                    code = original_line.rstrip("\n")
+                    edits.append((start + len(code), end, comment))
+                    commented.add(line_idx)
 
                     actions.append(
                         FixAction(
                             type=FixType.COMMENT_TODO,
                             line=v.get("line", 0),
                             original_code=original_line.strip(),
-                            fixed_code=lines[line_idx].strip(),
+                            fixed_code=(code + comment).strip(),
                             description=f"Added TODO for {vtype}",
                             violation=v,
                         )
                     )
 
-        return "".join(lines), actions
+        # Splice every comment into the source in one pass
+        pieces: List[str] = []
+        prev = 0
+        for start, end, text in sorted(edits):
+            pieces.append(source[prev:start])
+            pieces.append(text)
+            prev = end
+        pieces.append(source[prev:])
+
+        return "".join(pieces), actions
 
     def _validate_python(self, source: str) -> None:
         """Validate that source is valid Python."""
@@ -555,15 +587,7 @@ class DemystFixer:
 
     def _get_fix_description(self, violation: Dict[str, Any]) -> str:
         """Get a description of the fix."""
-        vtype = violation.get("type", "unknown")
-        descriptions = {
-            "mean": "Transform np.mean to VariationTensor.collapse('mean')",
-            "sum": "Transform np.sum to VariationTensor.ensemble_sum()",
-            "argmax": "Transform np.argmax to VariationTensor.collapse('argmax')",
-            "argmin": "Transform np.argmin to VariationTensor.collapse('argmin')",
-            "premature_discretization": "Wrap discretization in VariationTensor tracking",
-        }
-        return descriptions.get(vtype, "Auto-fix not yet implemented")
+        return self.FIX_TABLE.get(violation.get("type", "unknown"), "Auto-fix not yet implemented")
 
 
 # =============================================================================
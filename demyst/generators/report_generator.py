@@ -10,6 +10,8 @@ from dataclasses import dataclass
 from datetime import datetime
 from typing import Any, Dict, List, Optional, cast
 
+from demyst._json import dumps as json_dumps
+
 
 @dataclass
 class ReportSection:
@@ -311,7 +313,7 @@ class IntegrityReportGenerator:
 
     def to_json(self) -> str:
         """Generate JSON report."""
-        return json.dumps(
+        return json_dumps(
             {
                 "title": self.title,
                 "metadata": self.metadata,
@@ -326,8 +328,7 @@ class IntegrityReportGenerator:
                     }
                     for s in self.sections
                 ],
-            },
-            indent=2,
+            }
         )
 
     def to_dict(self) -> Dict[str, Any]:
@@ -11,15 +11,38 @@ Guards:
     - UnitGuard: Dimensional analysis and unit consistency
 """
 
-from .hypothesis_guard import BonferroniCorrector, ExperimentTracker, HypothesisGuard
-from .leakage_hunter import DataFlowTracker, LeakageHunter, TaintAnalyzer
-from .tensor_guard import (
-    GradientDeathDetector,
-    NormalizationAnalyzer,
-    RewardHackingDetector,
-    TensorGuard,
-)
-from .unit_guard import DimensionalAnalyzer, UnitGuard, UnitInferenceEngine
+import importlib
+from typing import Any, Dict
+
+# Guards are imported on first attribute access, so loading one guard module
+# (e.g. from a single CLI command) does not pull in all the others
+_LAZY_ATTRS: Dict[str, str] = {
+    "TensorGuard": "tensor_guard",
+    "GradientDeathDetector": "tensor_guard",
+    "NormalizationAnalyzer": "tensor_guard",
+    "RewardHackingDetector": "tensor_guard",
+    "LeakageHunter": "leakage_hunter",
+    "TaintAnalyzer": "leakage_hunter",
+    "DataFlowTracker": "leakage_hunter",
+    "HypothesisGuard": "hypothesis_guard",
+    "BonferroniCorrector": "hypothesis_guard",
+    "ExperimentTracker": "hypothesis_guard",
+    "UnitGuard": "unit_guard",
+    "DimensionalAnalyzer": "unit_guard",
+    "UnitInferenceEngine": "unit_guard",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import the guard module that provides ``name`` on first access."""
+    module = _LAZY_ATTRS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
 
 __all__ = [
     "TensorGuard",
@@ -15,11 +15,17 @@ import hashlib
 import json
 import math
 import re
+from collections import Counter
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 from typing import Any, Dict, List, Optional, Set, Tuple, cast
 
+import numpy as np
+
+from demyst._jit import jit
+from demyst.utils import SharedInstanceMixin
+
 
 class StatisticalRisk(Enum):
     """Risk levels for statistical validity issues."""
@@ -79,6 +85,45 @@ class LoopContext:
     significance_exits: List[int] = field(default_factory=list)
 
 
+@jit
+def _holm_kernel(sorted_p: np.ndarray, alpha: float) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Step-down Holm thresholds, corrected p-values and decisions for ascending p."""
+    n = sorted_p.shape[0]
+    adjusted = np.empty(n)
+    corrected = np.empty(n)
+    significant = np.zeros(n, dtype=np.bool_)
+    stopped = False
+
+    for rank in range(n):
+        remaining = n - rank
+        adjusted[rank] = alpha / remaining
+        corrected[rank] = min(sorted_p[rank] * remaining, 1.0)
+
+        # Holm's procedure: if we fail to reject at any step, stop rejecting
+        if not stopped and sorted_p[rank] <= adjusted[rank]:
+            significant[rank] = True
+        elif sorted_p[rank] > adjusted[rank]:
+            stopped = True
+
+    return adjusted, corrected, significant
+
+
+@jit
+def _benjamini_hochberg_kernel(sorted_p: np.ndarray, alpha: float) -> Tuple[int, np.ndarray]:
+    """Largest BH-significant rank (1-based) and corrected p-values for ascending p."""
+    n = sorted_p.shape[0]
+    corrected = np.empty(n)
+    max_significant_rank = 0
+
+    # Find largest k where p(k) <= k/n * alpha
+    for rank in range(1, n + 1):
+        if sorted_p[rank - 1] <= (rank / n) * alpha:
+            max_significant_rank = rank
+        corrected[rank - 1] = min((n / rank) * sorted_p[rank - 1], 1.0)
+
+    return max_significant_rank, corrected
+
+
 class BonferroniCorrector:
     """
     Applies Bonferroni and other multiple comparison corrections.
@@ -120,23 +165,18 @@ class BonferroniCorrector:
         Less conservative than Bonferroni while still controlling FWER.
         """
         n = len(p_values)
-        indexed = [(p, i) for i, p in enumerate(p_values)]
-        sorted_p = sorted(indexed)
+        p_array = np.asarray(p_values, dtype=np.float64)
+        order = np.argsort(p_array, kind="stable")
+        sorted_p = p_array[order]
+        adjusted, corrected, significant = _holm_kernel(sorted_p, alpha)
 
         results: List[Optional[CorrectedResult]] = [None] * n
-        rejected_any = False
-
-        for rank, (p, original_idx) in enumerate(sorted_p):
-            adjusted_alpha = alpha / (n - rank)
-            corrected_p = min(p * (n - rank), 1.0)
 
-            # Holm's procedure: if we fail to reject at any step, stop rejecting
-            if not rejected_any and p <= adjusted_alpha:
-                is_significant = True
-            else:
-                if p > adjusted_alpha:
-                    rejected_any = True
-                is_significant = False
+        for rank, original_idx in enumerate(order.tolist()):
+            p = float(sorted_p[rank])
+            adjusted_alpha = float(adjusted[rank])
+            corrected_p = float(corrected[rank])
+            is_significant = bool(significant[rank])
 
             results[original_idx] = CorrectedResult(
                 original_p_value=p,
@@ -161,21 +201,17 @@ class BonferroniCorrector:
         More powerful than Bonferroni for large numbers of tests.
         """
         n = len(p_values)
-        indexed = [(p, i) for i, p in enumerate(p_values)]
-        sorted_p = sorted(indexed)
+        p_array = np.asarray(p_values, dtype=np.float64)
+        order = np.argsort(p_array, kind="stable")
+        sorted_p = p_array[order]
+        max_significant_rank, corrected = _benjamini_hochberg_kernel(sorted_p, alpha)
 
         results: List[Optional[CorrectedResult]] = [None] * n
-        max_significant_rank = 0
-
-        # Find largest k where p(k) <= k/n * alpha
-        for rank, (p, original_idx) in enumerate(sorted_p, 1):
-            threshold = (rank / n) * alpha
-            if p <= threshold:
-                max_significant_rank = rank
 
         # All tests with rank <= max_significant_rank are significant
-        for rank, (p, original_idx) in enumerate(sorted_p, 1):
-            corrected_p = min((n / rank) * p, 1.0)
+        for rank, original_idx in enumerate(order.tolist(), 1):
+            p = float(sorted_p[rank - 1])
+            corrected_p = float(corrected[rank - 1])
 
             results[original_idx] = CorrectedResult(
                 original_p_value=p,
@@ -251,12 +287,13 @@ class ExperimentTracker:
     ) -> ExperimentRecord:
         """Record a new experiment."""
         code_hash = hashlib.sha256(code.encode()).hexdigest()[:16] if code else "unknown"
+        # One clock read serves both the ID and the stored timestamp
+        timestamp = datetime.now().isoformat()
+        experiment_id = hashlib.sha256(f"{timestamp}{seed}{metric_value}".encode()).hexdigest()
 
         record = ExperimentRecord(
-            experiment_id=hashlib.sha256(
-                f"{datetime.now().isoformat()}{seed}{metric_value}".encode()
-            ).hexdigest()[:16],
-            timestamp=datetime.now().isoformat(),
+            experiment_id=experiment_id[:16],
+            timestamp=timestamp,
             hyperparameters=hyperparameters,
             seed=seed,
             metric_name=metric_name,
@@ -665,7 +702,7 @@ class HypothesisAnalyzer(ast.NodeVisitor):
         )
 
 
-class HypothesisGuard:
+class HypothesisGuard(SharedInstanceMixin):
     """
     Main interface for hypothesis testing validity analysis.
 
@@ -676,6 +713,8 @@ class HypothesisGuard:
         4. Generates corrected statistical interpretations
     """
 
+    __slots__ = ("config", "corrector", "tracker", "analyzer")
+
     def __init__(
         self, config: Optional[Dict[str, Any]] = None, experiment_storage: Optional[str] = None
     ) -> None:
@@ -684,6 +723,10 @@ class HypothesisGuard:
         self.tracker = ExperimentTracker(experiment_storage)
         self.analyzer: Optional[HypothesisAnalyzer] = None
 
+    def reset(self) -> None:
+        """Drop the analyzer from the previous run."""
+        self.analyzer = None
+
     def analyze_code(self, source: str) -> Dict[str, Any]:
         """
         Analyze source code for p-hacking patterns.
@@ -699,6 +742,18 @@ class HypothesisGuard:
         except SyntaxError as e:
             return {"error": f"Syntax error: {e}", "violations": [], "summary": None}
 
+        return self.analyze_tree(tree)
+
+    def analyze_tree(self, tree: ast.AST) -> Dict[str, Any]:
+        """
+        Analyze an already-parsed AST for p-hacking patterns.
+
+        Args:
+            tree: Parsed Python AST
+
+        Returns:
+            Analysis results including violations and recommendations
+        """
         # Pass config to analyzer for physics mode support
         self.analyzer = HypothesisAnalyzer(config=self.config)
         self.analyzer.visit(tree)
@@ -821,8 +876,9 @@ class HypothesisGuard:
             return {"error": "No analysis performed"}
 
         violations = self.analyzer.violations
-        invalid = sum(1 for v in violations if v.severity == StatisticalRisk.INVALID)
-        questionable = sum(1 for v in violations if v.severity == StatisticalRisk.QUESTIONABLE)
+        severities = Counter(v.severity for v in violations)
+        invalid = severities[StatisticalRisk.INVALID]
+        questionable = severities[StatisticalRisk.QUESTIONABLE]
 
         if invalid > 0:
             verdict = "FAIL: Invalid statistical practices detected."
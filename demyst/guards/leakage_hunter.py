@@ -13,6 +13,8 @@ from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any, Dict, List, Optional, Set, Tuple, cast
 
+from demyst.utils import SharedInstanceMixin
+
 
 class TaintLevel(Enum):
     """Taint levels for data flow tracking."""
@@ -658,15 +660,27 @@ class TaintAnalyzer(ast.NodeVisitor):
                 )
 
 
-class LeakageHunter:
+class LeakageHunter(SharedInstanceMixin):
     """
     Main interface for data leakage detection.
     """
 
+    # Source-level patterns, compiled once at import
+    FIT_TRANSFORM_PATTERN = re.compile(r"\.fit_transform\s*\(\s*(\w+)")
+    SPLIT_PATTERN = re.compile(r"train_test_split")
+    CROSS_VAL_PATTERN = re.compile(r"cross_val_score\s*\(")
+    TARGET_ENCODING_PATTERN = re.compile(r"(TargetEncoder|target_encode|WOEEncoder)\s*\(")
+
+    __slots__ = ("config", "analyzer")
+
     def __init__(self, config: Optional[Dict[str, Any]] = None):
         self.config = config or {}
         self.analyzer: Optional[TaintAnalyzer] = None
 
+    def reset(self) -> None:
+        """Drop the analyzer from the previous run."""
+        self.analyzer = None
+
     def analyze(self, source: str) -> Dict[str, Any]:
         """
         Analyze source code for data leakage.
@@ -687,6 +701,20 @@ class LeakageHunter:
                 "summary": None,
             }
 
+        return self.analyze_tree(tree, source)
+
+    def analyze_tree(self, tree: ast.AST, source: str) -> Dict[str, Any]:
+        """
+        Analyze an already-parsed AST for data leakage.
+
+        Args:
+            tree: Parsed AST of ``source``
+            source: The source code the tree was parsed from, used for
+                pattern-based detection
+
+        Returns:
+            Dictionary containing analysis results
+        """
         # Add parent references for context
         self._add_parent_refs(tree)
 
@@ -724,9 +752,9 @@ class LeakageHunter:
         lines = source.split("\n")
 
         # Pattern 1: fit_transform on full data, then split
-        fit_transform_pattern = re.compile(r"\.fit_transform\s*\(\s*(\w+)")
-        split_pattern = re.compile(r"train_test_split")
-        cross_val_pattern = re.compile(r"cross_val_score\s*\(")
+        fit_transform_pattern = self.FIT_TRANSFORM_PATTERN
+        split_pattern = self.SPLIT_PATTERN
+        cross_val_pattern = self.CROSS_VAL_PATTERN
 
         fit_transform_line = None
         fit_transform_var = None
@@ -793,8 +821,7 @@ class LeakageHunter:
                     fit_transform_line = None
 
         # Pattern 2: cross_val_score after target encoding/feature selection
-        target_encoding_pattern = re.compile(r"(TargetEncoder|target_encode|WOEEncoder)\s*\(")
-        cross_val_pattern = re.compile(r"cross_val_score\s*\(")
+        target_encoding_pattern = self.TARGET_ENCODING_PATTERN
 
         for i, line in enumerate(lines, 1):
             if target_encoding_pattern.search(line):
@@ -10,11 +10,14 @@ Philosophy: "If the gradient dies in silence, the model learns nothing."
 """
 
 import ast
+import re
 import warnings
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any, Dict, List, Optional, Set, Tuple, cast
 
+from demyst.utils import SharedInstanceMixin
+
 
 class GradientRisk(Enum):
     """Risk levels for gradient flow issues."""
@@ -495,7 +498,7 @@ class RewardHackingDetector(ast.NodeVisitor):
                 )
 
 
-class TensorGuard:
+class TensorGuard(SharedInstanceMixin):
     """
     Main entry point for deep learning integrity analysis.
 
@@ -505,12 +508,25 @@ class TensorGuard:
         - RewardHackingDetector: RL reward function vulnerability detection
     """
 
+    # Every issue the detectors can raise needs a saturating activation, a
+    # normalization layer or a reward function; source without any of these
+    # names can skip the AST walk entirely
+    TRIAGE = re.compile(r"sigmoid|tanh|softmax|norm|reward", re.IGNORECASE)
+
+    __slots__ = ("config", "gradient_detector", "norm_analyzer", "reward_detector")
+
     def __init__(self, config: Optional[Dict[str, Any]] = None):
         self.config = config or {}
         self.gradient_detector = GradientDeathDetector()
         self.norm_analyzer = NormalizationAnalyzer()
         self.reward_detector = RewardHackingDetector()
 
+    def reset(self) -> None:
+        """Replace the detectors with fresh ones."""
+        self.gradient_detector = GradientDeathDetector()
+        self.norm_analyzer = NormalizationAnalyzer()
+        self.reward_detector = RewardHackingDetector()
+
     def analyze(self, source: str) -> Dict[str, Any]:
         """
         Analyze source code for deep learning integrity issues.
@@ -534,10 +550,20 @@ class TensorGuard:
                 "summary": None,
             }
 
+        return self.analyze_tree(tree)
+
+    def analyze_tree(self, tree: ast.AST) -> Dict[str, Any]:
+        """
+        Analyze an already-parsed AST for deep learning integrity issues.
+
+        Args:
+            tree: Parsed Python AST
+
+        Returns:
+            Dictionary containing all detected issues and recommendations
+        """
         # Run all detectors
-        self.gradient_detector = GradientDeathDetector()
-        self.norm_analyzer = NormalizationAnalyzer()
-        self.reward_detector = RewardHackingDetector()
+        self.reset()
 
         self.gradient_detector.visit(tree)
         self.norm_analyzer.visit(tree)
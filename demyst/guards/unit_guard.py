@@ -12,10 +12,14 @@ Philosophy: "The universe doesn't care about your naming conventions.
 """
 
 import ast
+import functools
 import re
+from collections import Counter
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, Dict, FrozenSet, List, Optional, Set, Tuple
+from typing import Any, Dict, FrozenSet, List, Optional, Pattern, Set, Tuple
+
+from demyst.utils import SharedInstanceMixin
 
 
 class BaseDimension(Enum):
@@ -272,6 +276,28 @@ ML_PATTERNS = {
 }
 
 
+@functools.lru_cache(maxsize=None)
+def _compile_unit_patterns(
+    ml_patterns: bool, tensor_conventions: bool
+) -> Tuple[Tuple[Pattern[str], Dimension], ...]:
+    """Compile the name->dimension patterns once per configuration."""
+    # ML patterns are checked FIRST to avoid false positives on y_pred, X_train, etc.
+    patterns: Dict[str, Dimension] = {}
+
+    # Add ML patterns first (highest priority) unless explicitly disabled
+    if ml_patterns:
+        patterns.update(ML_PATTERNS)
+
+    # Add physics unit patterns
+    patterns.update(UNIT_PATTERNS)
+
+    # Add tensor convention patterns if enabled
+    if tensor_conventions:
+        patterns.update(TENSOR_CONVENTION_PATTERNS)
+
+    return tuple((re.compile(pattern, re.IGNORECASE), dim) for pattern, dim in patterns.items())
+
+
 class UnitInferenceEngine:
     """
     Infers dimensional types from code context.
@@ -291,24 +317,11 @@ class UnitInferenceEngine:
         self.config = config or {}
         self.type_environment: Dict[str, Dimension] = {}
 
-        # Build pattern list based on config
-        # ML patterns are checked FIRST to avoid false positives on y_pred, X_train, etc.
-        patterns: Dict[str, Dimension] = {}
-
-        # Add ML patterns first (highest priority) unless explicitly disabled
-        if self.config.get("ml_patterns", True):
-            patterns.update(ML_PATTERNS)
-
-        # Add physics unit patterns
-        patterns.update(UNIT_PATTERNS)
-
-        # Add tensor convention patterns if enabled
-        if self.config.get("tensor_conventions", False):
-            patterns.update(TENSOR_CONVENTION_PATTERNS)
-
-        self.compiled_patterns = [
-            (re.compile(pattern, re.IGNORECASE), dim) for pattern, dim in patterns.items()
-        ]
+        # Build pattern list based on config (compiled once per configuration)
+        self.compiled_patterns = _compile_unit_patterns(
+            bool(self.config.get("ml_patterns", True)),
+            bool(self.config.get("tensor_conventions", False)),
+        )
 
         # Track natural units mode
         self.natural_units = self.config.get("natural_units", False)
@@ -717,7 +730,7 @@ class DimensionalAnalyzer(ast.NodeVisitor):
         return None
 
 
-class UnitGuard:
+class UnitGuard(SharedInstanceMixin):
     """
     Main interface for dimensional analysis.
 
@@ -729,10 +742,16 @@ class UnitGuard:
             print(f"Line {v['line']}: {v['description']}")
     """
 
+    __slots__ = ("config", "analyzer")
+
     def __init__(self, config: Optional[Dict[str, Any]] = None) -> None:
         self.config = config or {}
         self.analyzer: Optional[DimensionalAnalyzer] = None
 
+    def reset(self) -> None:
+        """Drop the analyzer from the previous run."""
+        self.analyzer = None
+
     def analyze(self, source: str) -> Dict[str, Any]:
         """
         Analyze source code for dimensional consistency.
@@ -753,6 +772,20 @@ class UnitGuard:
                 "summary": None,
             }
 
+        return self.analyze_tree(tree)
+
+    def analyze_tree(self, tree: ast.AST) -> Dict[str, Any]:
+        """
+        Analyze an already-parsed AST for dimensional consistency.
+
+        Lets callers that parse once (or cache parsed trees) skip re-parsing.
+
+        Args:
+            tree: Parsed Python AST
+
+        Returns:
+            Analysis results including violations and type inferences
+        """
         self.analyzer = DimensionalAnalyzer(self.config)
         self.analyzer.visit(tree)
 
@@ -798,8 +831,9 @@ class UnitGuard:
             return {"error": "No analysis performed"}
 
         violations = self.analyzer.violations
-        critical = sum(1 for v in violations if v.severity == "critical")
-        warning = sum(1 for v in violations if v.severity == "warning")
+        severities = Counter(v.severity for v in violations)
+        critical = severities["critical"]
+        warning = severities["warning"]
 
         if critical > 0:
             verdict = "FAIL: Critical dimensional inconsistencies detected."
@@ -0,0 +1,180 @@
+"""
+CI Daemon: Persistent In-Process Analysis Server
+
+Keeps one CIEnforcer (and its parsed-tree cache) alive behind a Unix socket so
+pre-commit hooks and CI wrappers that check files one at a time do not pay
+interpreter startup and import cost per file.
+
+Unix only: this module needs ``socketserver.UnixStreamServer``.
+
+Protocol: each request line is a file path; each response line is the JSON
+result of ``CIEnforcer.analyze_file`` for that path. ``demyst-client`` sends
+absolute paths and exits 1 when any reply is an error or has a blocking or
+critical issue, the same issues that fail ``demyst ci``.
+
+The daemon reads any file its owner can read, so the socket is private: the
+default path is per user (``$XDG_RUNTIME_DIR/demyst.sock``, or
+``demyst-<uid>.sock`` in the temp directory) and the socket is chmod 0600.
+
+Usage:
+    demyst ci --daemon
+    git diff --name-only -- '*.py' | demyst-client
+"""
+
+import argparse
+import json
+import os
+import socket
+import socketserver
+import stat
+import sys
+import tempfile
+from typing import Any, Dict, List, Optional
+
+from demyst.utils import TreeCache
+
+from .ci_enforcer import _CHECK_SPECS, CIEnforcer
+
+
+def _default_socket_path() -> str:
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime_dir:
+        return os.path.join(runtime_dir, "demyst.sock")
+    return os.path.join(tempfile.gettempdir(), f"demyst-{os.getuid()}.sock")
+
+
+DEFAULT_SOCKET_PATH = _default_socket_path()
+
+
+class _AnalyzeHandler(socketserver.StreamRequestHandler):
+    """Answers each path line with one JSON line."""
+
+    server: "CIDaemon"
+
+    def handle(self) -> None:
+        for raw in self.rfile:
+            # A bad line gets an error reply; dropping the connection would
+            # leave the client with no answer at all
+            try:
+                path = raw.decode("utf-8").strip()
+                if not path:
+                    continue
+                result = self.server.enforcer.analyze_file(path)
+            except Exception as e:
+                result = {"error": f"Failed to analyze {raw!r}: {e}"}
+            self.wfile.write(json.dumps(result, default=str).encode("utf-8") + b"\n")
+            self.wfile.flush()
+
+
+def _remove_stale_socket(socket_path: str) -> None:
+    """
+    Unlink a socket file left behind by a daemon that is no longer running.
+
+    Raises FileExistsError when the path is not a socket, or when a daemon
+    still answers on it.
+    """
+    if not stat.S_ISSOCK(os.lstat(socket_path).st_mode):
+        raise FileExistsError(f"{socket_path} exists and is not a socket")
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+        try:
+            probe.connect(socket_path)
+        except OSError:
+            os.unlink(socket_path)
+            return
+    raise FileExistsError(f"A demyst daemon is already listening on {socket_path}")
+
+
+class CIDaemon(socketserver.UnixStreamServer):
+    """Unix socket server that analyzes files with a shared CIEnforcer."""
+
+    def __init__(self, socket_path: str, enforcer: Optional[CIEnforcer] = None) -> None:
+        if os.path.lexists(socket_path):
+            _remove_stale_socket(socket_path)
+        self.socket_path = socket_path
+        self.enforcer = enforcer or CIEnforcer()
+        if self.enforcer.tree_cache is None:
+            # Hooks send the same files again and again; keep their parsed trees
+            self.enforcer.tree_cache = TreeCache()
+        super().__init__(socket_path, _AnalyzeHandler)
+
+    def server_bind(self) -> None:
+        super().server_bind()
+        # Other local users must not be able to make us read files for them
+        os.chmod(self.socket_path, 0o600)
+
+    def server_close(self) -> None:
+        super().server_close()
+        if os.path.exists(self.socket_path):
+            os.unlink(self.socket_path)
+
+
+def serve(socket_path: Optional[str] = None, config_path: Optional[str] = None) -> int:
+    """Run the daemon until interrupted."""
+    socket_path = socket_path or DEFAULT_SOCKET_PATH
+
+    try:
+        daemon = CIDaemon(socket_path, CIEnforcer(config_path=config_path))
+    except FileExistsError as e:
+        print(f"demyst daemon: {e}", file=sys.stderr)
+        return 1
+
+    with daemon:
+        print(f"demyst daemon listening on {socket_path}", file=sys.stderr)
+        try:
+            daemon.serve_forever()
+        except KeyboardInterrupt:
+            pass
+    return 0
+
+
+def _fails_check(result: Dict[str, Any]) -> bool:
+    """Whether one analyze_file reply is an error or has a blocking or critical issue."""
+    if result.get("error"):
+        return True
+    for _, result_key, issue_keys, critical_types in _CHECK_SPECS:
+        guard_result = result.get(result_key)
+        if not guard_result or guard_result.get("error"):
+            continue
+        for issue_key in issue_keys:
+            for issue in guard_result.get(issue_key, []):
+                if (
+                    issue.get("blocking", True)
+                    or issue.get("severity") == "critical"
+                    or issue.get("type") in critical_types
+                ):
+                    return True
+    return False
+
+
+def client_main(argv: Optional[List[str]] = None) -> int:
+    """Send paths from stdin to a running daemon and print its JSON replies."""
+    parser = argparse.ArgumentParser(prog="demyst-client")
+    parser.add_argument("--socket", default=DEFAULT_SOCKET_PATH, help="Daemon socket path")
+    args = parser.parse_args(argv)
+
+    exit_code = 0
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        try:
+            sock.connect(args.socket)
+        except OSError:
+            print(f"demyst-client: no demyst daemon on {args.socket}", file=sys.stderr)
+            return 1
+        stream = sock.makefile("rwb")
+        for line in sys.stdin:
+            if line.strip():
+                # The daemon resolves relative paths against its own cwd, not ours
+                path = os.path.abspath(line.strip())
+                stream.write(path.encode("utf-8") + b"\n")
+                stream.flush()
+                reply = stream.readline()
+                if not reply:
+                    print("demyst-client: daemon closed the connection", file=sys.stderr)
+                    return 1
+                sys.stdout.write(reply.decode("utf-8"))
+                if _fails_check(json.loads(reply)):
+                    exit_code = 1
+    return exit_code
+
+
+if __name__ == "__main__":
+    sys.exit(client_main())
@@ -9,15 +9,29 @@ Generates comprehensive reports for CI/CD pipelines that check:
     5. Deep learning integrity
 """
 
+import ast
 import json
 import logging
 import os
+import re
+import threading
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+)
 
 from demyst.config.manager import ConfigManager
+from demyst.utils import TreeCache, load_tree
 
 logger = logging.getLogger(__name__)  # Add this line
 
@@ -160,6 +174,118 @@ class ScientificIntegrityReport:
         return "\n".join(lines)
 
 
+# Integrity checks reported by analyze_directory:
+# (check name, analyze_file result key, issue list keys, issue types that make it critical)
+_CHECK_SPECS: Tuple[Tuple[str, str, Tuple[str, ...], FrozenSet[str]], ...] = (
+    ("Computational Mirages", "mirage", ("issues",), frozenset({"mean", "sum", "argmax"})),
+    (
+        "Deep Learning Integrity",
+        "tensor",
+        ("gradient_issues", "normalization_issues", "reward_issues"),
+        frozenset({"gradient_death_chain"}),
+    ),
+    (
+        "Data Leakage",
+        "leakage",
+        ("violations",),
+        frozenset({"test_in_training", "test_in_tuning"}),
+    ),
+    (
+        "Statistical Validity",
+        "hypothesis",
+        ("violations",),
+        frozenset({"uncorrected_multiple_tests"}),
+    ),
+    ("Dimensional Consistency", "unit", ("violations",), frozenset({"incompatible_addition"})),
+)
+
+# Below this many files a process pool costs more to start than it saves
+_PARALLEL_MIN_FILES = 16
+
+# Per-process enforcer used by pool workers (set by _init_worker)
+_worker_enforcer: Optional["CIEnforcer"] = None
+
+
+def _init_worker(enforcer: "CIEnforcer") -> None:
+    global _worker_enforcer
+    _worker_enforcer = enforcer
+
+
+def _analyze_file_in_worker(filepath: str) -> Dict[str, Any]:
+    assert _worker_enforcer is not None
+    return _worker_enforcer.analyze_file(filepath)
+
+
+IGNORE_FILE = ".demystignore"
+
+# "*/name/*" or "**/name/**": excludes every file below any directory called
+# ``name``, so the walk can skip such directories without listing them
+_ANY_DEPTH_DIR_PATTERN = re.compile(r"^\*\*?/([^*?\[\]/]+)/\*\*?$")
+
+
+def _read_ignore_file(directory: str) -> List[str]:
+    """
+    Translate ``directory/.demystignore`` into fnmatch exclude patterns.
+
+    Supports the common gitignore subset: blank lines and ``#`` comments are
+    skipped, a trailing ``/`` matches directories only, a leading or inner
+    ``/`` anchors the pattern at ``directory``, and anything else matches at
+    any depth. Negated (``!``) lines are not supported and are skipped.
+    """
+    try:
+        with open(os.path.join(directory, IGNORE_FILE), encoding="utf-8") as f:
+            lines = f.read().splitlines()
+    except OSError:
+        return []
+
+    patterns = []
+    for line in lines:
+        line = line.strip()
+        if not line or line.startswith(("#", "!")):
+            continue
+        is_dir = line.endswith("/")
+        name = line.strip("/")
+        if not name:
+            continue
+        roots = [name] if "/" in line.rstrip("/") else [name, "*/" + name]
+        for root in roots:
+            patterns.append(root + "/*")
+            if not is_dir:
+                patterns.append(root)
+    return patterns
+
+
+def _pruned_dir_names(patterns: Iterable[str]) -> FrozenSet[str]:
+    """Directory names that exclude everything beneath them at any depth."""
+    return frozenset(
+        match.group(1) for match in map(_ANY_DEPTH_DIR_PATTERN.match, patterns) if match
+    )
+
+
+def _scan_python_files(directory: str, prune: FrozenSet[str] = frozenset()) -> Iterator[str]:
+    """
+    Yield every ``.py`` file under ``directory`` using ``os.scandir``.
+
+    Subdirectories whose name is in ``prune`` are not descended into, except
+    top-level ones under a root of ``"."``: their paths have no ``/`` before
+    the name, so the ``**/name/**`` exclude patterns never matched them.
+    """
+    top_prune = frozenset() if str(Path(directory)) == "." else prune
+    stack = [(directory, top_prune)]
+    while stack:
+        path, skip = stack.pop()
+        try:
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in skip:
+                            stack.append((entry.path, prune))
+                    elif entry.name.endswith(".py") and entry.is_file():
+                        yield entry.path
+        except OSError:
+            continue
+
+
 class CIEnforcer:
     """
     Main class for CI/CD enforcement of scientific integrity.
@@ -171,17 +297,45 @@ class CIEnforcer:
         sys.exit(0 if report.badge_status == 'passing' else 1)  # For CI
     """
 
-    def __init__(self, config_path: Optional[str] = None):
+    def __init__(self, config_path: Optional[str] = None, tree_cache: Optional[TreeCache] = None):
         """
         Initialize the CI enforcer.
 
         Args:
             config_path: Optional path to a configuration file
+            tree_cache: Parsed-file cache to reuse across ``analyze_file`` calls,
+                for long-lived callers such as the CI daemon
         """
+        self.tree_cache = tree_cache
         self.config_manager = ConfigManager(config_path=config_path)
         self.config = self.config_manager.config
+        self._guard_pool = threading.local()
         self._import_guards()
 
+    def __getstate__(self) -> Dict[str, Any]:
+        # Pool workers receive a pickled enforcer; thread-local pools stay behind
+        state = self.__dict__.copy()
+        del state["_guard_pool"]
+        state["tree_cache"] = None
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._guard_pool = threading.local()
+
+    def _pooled_guard(self, rule: str, factory: Callable[..., Any]) -> Any:
+        """Return this thread's configured instance of ``factory``, reset for a new file."""
+        guards: Optional[Dict[str, Any]] = getattr(self._guard_pool, "guards", None)
+        if guards is None:
+            guards = self._guard_pool.guards = {}
+
+        guard = guards.get(rule)
+        if guard is None:
+            guard = guards[rule] = factory(config=self.config_manager.get_rule_config(rule))
+        else:
+            guard.reset()
+        return guard
+
     def _import_guards(self) -> None:
         """Import guard classes (lazy to avoid circular imports)."""
         try:
@@ -214,9 +368,9 @@ class CIEnforcer:
         if not self._guards_available:
             return {"error": f"Guards not available: {self._import_error}"}
 
+        # Read and parse once; every guard below works off the same tree
         try:
-            with open(filepath, "r", encoding="utf-8") as f:
-                source = f.read()
+            source, tree = load_tree(filepath, self.tree_cache)
         except Exception as e:
             return {"error": f"Failed to read file: {e}"}
 
@@ -232,12 +386,15 @@ class CIEnforcer:
         # Run mirage detection
         if self.config_manager.is_rule_enabled("mirage"):
             try:
-                import ast
-
-                tree = ast.parse(source)
-                detector = self.MirageDetector(config=self.config_manager.get_rule_config("mirage"))
+                # Re-parsing an unparsable file surfaces its syntax error here
+                mirage_tree = tree if tree is not None else ast.parse(source)
+                detector = self._pooled_guard("mirage", self.MirageDetector)
                 # Use analyze() for variance context-aware detection
-                mirages = detector.analyze(tree)
+                mirages = (
+                    detector.analyze(mirage_tree)
+                    if self.MirageDetector.TRIAGE.search(source)
+                    else []
+                )
                 issues = []
                 for m in mirages:
                     issues.append(
@@ -267,10 +424,16 @@ class CIEnforcer:
         # Run tensor guard (deep learning checks)
         if self.config_manager.is_rule_enabled("tensor"):
             try:
-                tensor_guard = self.TensorGuard(
-                    config=self.config_manager.get_rule_config("tensor")
-                )
-                results["tensor"] = tensor_guard.analyze(source)
+                tensor_guard = self._pooled_guard("tensor", self.TensorGuard)
+                if tree is None:
+                    results["tensor"] = tensor_guard.analyze(source)
+                elif self.TensorGuard.TRIAGE.search(source):
+                    results["tensor"] = tensor_guard.analyze_tree(tree)
+                else:
+                    # Nothing the detectors look for; report the empty-module result
+                    results["tensor"] = tensor_guard.analyze_tree(
+                        ast.Module(body=[], type_ignores=[])
+                    )
             except Exception as e:
                 results["tensor"] = {"error": str(e)}
         else:
@@ -279,10 +442,12 @@ class CIEnforcer:
         # Run leakage hunter
         if self.config_manager.is_rule_enabled("leakage"):
             try:
-                leakage_hunter = self.LeakageHunter(
-                    config=self.config_manager.get_rule_config("leakage")
+                leakage_hunter = self._pooled_guard("leakage", self.LeakageHunter)
+                results["leakage"] = (
+                    leakage_hunter.analyze(source)
+                    if tree is None
+                    else leakage_hunter.analyze_tree(tree, source)
                 )
-                results["leakage"] = leakage_hunter.analyze(source)
             except Exception as e:
                 results["leakage"] = {"error": str(e)}
         else:
@@ -291,10 +456,12 @@ class CIEnforcer:
         # Run hypothesis guard
         if self.config_manager.is_rule_enabled("hypothesis"):
             try:
-                hypothesis_guard = self.HypothesisGuard(
-                    config=self.config_manager.get_rule_config("hypothesis")
+                hypothesis_guard = self._pooled_guard("hypothesis", self.HypothesisGuard)
+                results["hypothesis"] = (
+                    hypothesis_guard.analyze_code(source)
+                    if tree is None
+                    else hypothesis_guard.analyze_tree(tree)
                 )
-                results["hypothesis"] = hypothesis_guard.analyze_code(source)
             except Exception as e:
                 results["hypothesis"] = {"error": str(e)}
         else:
@@ -303,8 +470,10 @@ class CIEnforcer:
         # Run unit guard
         if self.config_manager.is_rule_enabled("unit"):
             try:
-                unit_guard = self.UnitGuard(config=self.config_manager.get_rule_config("unit"))
-                results["unit"] = unit_guard.analyze(source)
+                unit_guard = self._pooled_guard("unit", self.UnitGuard)
+                results["unit"] = (
+                    unit_guard.analyze(source) if tree is None else unit_guard.analyze_tree(tree)
+                )
             except Exception as e:
                 results["unit"] = {"error": str(e)}
         else:
@@ -317,19 +486,24 @@ class CIEnforcer:
         directory: str,
         exclude_patterns: Optional[List[str]] = None,
         include_patterns: Optional[List[str]] = None,
+        max_workers: Optional[int] = None,
     ) -> ScientificIntegrityReport:
         """
         Analyze all Python files in a directory.
 
         Args:
             directory: Path to directory
-            exclude_patterns: Glob patterns to exclude
+            exclude_patterns: Glob patterns to exclude; patterns from a
+                ``.demystignore`` file in ``directory`` are always added
             include_patterns: Glob patterns to include (default: **/*.py)
+            max_workers: Worker processes for per-file analysis (default: CPU
+                count; 1 analyzes sequentially in this process)
 
         Returns:
             Complete integrity report
         """
         exclude_patterns = exclude_patterns or self.config_manager.get_ignore_patterns()
+        exclude_patterns = list(exclude_patterns) + _read_ignore_file(directory)
         include_patterns = include_patterns or ["**/*.py"]
 
         # Collect files
@@ -340,102 +514,75 @@ class CIEnforcer:
         all_files = []
 
         for pattern in include_patterns:
-            for filepath in base_path.glob(pattern):
-                if filepath.is_file():
-                    rel_path = str(filepath.relative_to(base_path))
-                    excluded = any(
-                        fnmatch.fnmatch(rel_path, exc) or fnmatch.fnmatch(str(filepath), exc)
-                        for exc in exclude_patterns
-                    )
-                    if not excluded:
-                        all_files.append(str(filepath))
+            if pattern == "**/*.py":
+                prune = _pruned_dir_names(exclude_patterns)
+                candidates: Iterable[Path] = map(Path, _scan_python_files(directory, prune))
+            else:
+                candidates = (p for p in base_path.glob(pattern) if p.is_file())
+            for filepath in candidates:
+                rel_path = str(filepath.relative_to(base_path))
+                excluded = any(
+                    fnmatch.fnmatch(rel_path, exc) or fnmatch.fnmatch(str(filepath), exc)
+                    for exc in exclude_patterns
+                )
+                if not excluded:
+                    all_files.append(str(filepath))
+        all_files.sort()
+
+        # Analyze each file, tallying per-check blocking counts and critical
+        # flags while issues are collected so no check is rescanned afterwards
+        check_issues: List[List[Dict[str, Any]]] = [[] for _ in _CHECK_SPECS]
+        check_blocking = [0] * len(_CHECK_SPECS)
+        check_critical = [False] * len(_CHECK_SPECS)
+
+        for file_path_str, result in zip(all_files, self._analyze_files(all_files, max_workers)):
+            for index, (_, result_key, issue_keys, critical_types) in enumerate(_CHECK_SPECS):
+                guard_result = result.get(result_key)
+                if not guard_result or guard_result.get("error"):
+                    continue
+                issues = check_issues[index]
+                for issue_key in issue_keys:
+                    for issue in guard_result.get(issue_key, []):
+                        issue["file"] = file_path_str
+                        issues.append(issue)
+                        if issue.get("blocking", True):
+                            check_blocking[index] += 1
+                        if (
+                            issue.get("severity") == "critical"
+                            or issue.get("type") in critical_types
+                        ):
+                            check_critical[index] = True
 
-        # Analyze each file
+        # Build check results
         all_checks = []
         total_issues = 0
         critical_issues = 0
         warning_issues = 0
         blocking_issues = 0
 
-        mirage_issues = []
-        tensor_issues = []
-        leakage_issues = []
-        hypothesis_issues = []
-        unit_issues = []
-
-        for file_path_str in all_files:
-            result = self.analyze_file(file_path_str)
-
-            # Collect mirage issues
-            if result.get("mirage") and not result["mirage"].get("error"):
-                for issue in result["mirage"].get("issues", []):
-                    issue["file"] = file_path_str
-                    mirage_issues.append(issue)
-
-            # Collect tensor issues
-            if result.get("tensor") and not result["tensor"].get("error"):
-                for issue in result["tensor"].get("gradient_issues", []):
-                    issue["file"] = file_path_str
-                    tensor_issues.append(issue)
-                for issue in result["tensor"].get("normalization_issues", []):
-                    issue["file"] = file_path_str
-                    tensor_issues.append(issue)
-                for issue in result["tensor"].get("reward_issues", []):
-                    issue["file"] = file_path_str
-                    tensor_issues.append(issue)
-
-            # Collect leakage issues
-            if result.get("leakage") and not result["leakage"].get("error"):
-                for issue in result["leakage"].get("violations", []):
-                    issue["file"] = file_path_str
-                    leakage_issues.append(issue)
-
-            # Collect hypothesis issues
-            if result.get("hypothesis") and not result["hypothesis"].get("error"):
-                for issue in result["hypothesis"].get("violations", []):
-                    issue["file"] = file_path_str
-                    hypothesis_issues.append(issue)
-
-            # Collect unit issues
-            if result.get("unit") and not result["unit"].get("error"):
-                for issue in result["unit"].get("violations", []):
-                    issue["file"] = file_path_str
-                    unit_issues.append(issue)
-
-        # Build check results
-        def make_check(name: str, issues: List, critical_types: List[str]) -> IntegrityCheck:
-            has_blocking = any(i.get("blocking", True) for i in issues)
-            has_critical = any(
-                i.get("severity") == "critical" or i.get("type") in critical_types for i in issues
-            )
-            severity = (
-                "critical" if has_blocking or has_critical else ("warning" if issues else "info")
-            )
-            return IntegrityCheck(
-                name=name,
-                passed=len(issues) == 0,
-                severity=severity,
-                issues=issues,
-                recommendations=self._generate_recommendations(name, issues),
+        for index, (name, _, _, _) in enumerate(_CHECK_SPECS):
+            issues = check_issues[index]
+            blocking_in_check = check_blocking[index]
+            if blocking_in_check or check_critical[index]:
+                severity = "critical"
+            else:
+                severity = "warning" if issues else "info"
+            all_checks.append(
+                IntegrityCheck(
+                    name=name,
+                    passed=len(issues) == 0,
+                    severity=severity,
+                    issues=issues,
+                    recommendations=self._generate_recommendations(name, issues),
+                )
             )
 
-        all_checks = [
-            make_check("Computational Mirages", mirage_issues, ["mean", "sum", "argmax"]),
-            make_check("Deep Learning Integrity", tensor_issues, ["gradient_death_chain"]),
-            make_check("Data Leakage", leakage_issues, ["test_in_training", "test_in_tuning"]),
-            make_check("Statistical Validity", hypothesis_issues, ["uncorrected_multiple_tests"]),
-            make_check("Dimensional Consistency", unit_issues, ["incompatible_addition"]),
-        ]
-
-        # Count issues with blocking awareness
-        for check in all_checks:
-            total_issues += len(check.issues)
-            blocking_in_check = sum(1 for i in check.issues if i.get("blocking", True))
-            nonblocking_in_check = len(check.issues) - blocking_in_check
+            # Count issues with blocking awareness
+            total_issues += len(issues)
             blocking_issues += blocking_in_check
-            if check.severity == "critical":
+            if severity == "critical":
                 critical_issues += blocking_in_check
-            warning_issues += nonblocking_in_check
+            warning_issues += len(issues) - blocking_in_check
 
         # Determine verdict (default: block only on blocking issues)
         if blocking_issues > 0:
@@ -449,8 +596,7 @@ class CIEnforcer:
             badge_status = "passing"
 
         # Get git info
-        commit = self._get_git_commit()
-        branch = self._get_git_branch()
+        commit, branch = self._get_git_revision()
         repo = self._get_repo_name(directory)
 
         return ScientificIntegrityReport(
@@ -498,32 +644,43 @@ class CIEnforcer:
 
         return recommendations
 
-    def _get_git_commit(self) -> str:
-        """Get current git commit hash."""
+    def _analyze_files(
+        self, files: List[str], max_workers: Optional[int] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """Analyze files in input order, fanning out to a process pool when worthwhile."""
+        workers = min(max_workers or os.cpu_count() or 1, len(files))
+        if workers <= 1 or len(files) < _PARALLEL_MIN_FILES:
+            for filepath in files:
+                yield self.analyze_file(filepath)
+            return
+
+        from concurrent.futures import ProcessPoolExecutor
+
+        # Each worker unpickles this enforcer once; files are batched so
+        # per-task IPC overhead stays small relative to the analysis itself
+        chunksize = max(1, len(files) // (4 * workers))
+        with ProcessPoolExecutor(
+            max_workers=workers, initializer=_init_worker, initargs=(self,)
+        ) as executor:
+            yield from executor.map(_analyze_file_in_worker, files, chunksize=chunksize)
+
+    def _get_git_revision(self) -> Tuple[str, str]:
+        """Get current git commit hash and branch from a single ``git rev-parse``."""
         try:
             import subprocess
 
             result = subprocess.run(
-                ["git", "rev-parse", "HEAD"], capture_output=True, text=True, timeout=5
-            )
-            return result.stdout.strip() if result.returncode == 0 else "unknown"
-        except Exception:
-            return "unknown"
-
-    def _get_git_branch(self) -> str:
-        """Get current git branch."""
-        try:
-            import subprocess
-
-            result = subprocess.run(
-                ["git", "rev-parse", "--abbrev-ref", "HEAD"],
+                ["git", "rev-parse", "HEAD", "--abbrev-ref", "HEAD"],
                 capture_output=True,
                 text=True,
                 timeout=5,
             )
-            return result.stdout.strip() if result.returncode == 0 else "unknown"
+            lines = result.stdout.split()
+            if result.returncode == 0 and len(lines) == 2:
+                return lines[0], lines[1]
         except Exception:
-            return "unknown"
+            pass
+        return "unknown", "unknown"
 
     def _get_repo_name(self, directory: str) -> str:
         """Get repository name from directory or git remote."""
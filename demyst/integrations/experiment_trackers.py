@@ -9,22 +9,222 @@ Provides integration with popular experiment tracking platforms to:
 """
 
 import json
+import math
+import time
 import warnings
+from bisect import bisect_left, bisect_right, insort
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
 
 
 @dataclass
 class ExperimentMetadata:
     """Metadata about an experiment run."""
 
+    # Declared by hand because dataclass(slots=True) needs Python 3.10
+    __slots__ = ("run_id", "timestamp", "seed", "config", "metrics", "tags")
+
     run_id: str
     timestamp: str
     seed: int
     config: Dict[str, Any]
     metrics: Dict[str, float]
-    tags: List[str]
+    tags: Sequence[str]
+
+
+# Shared by every run; a tuple so aliasing it across runs is safe
+_DEFAULT_TAGS: Tuple[str, ...] = ("demyst_tracked",)
+
+# MLflow rejects log_batch requests with more than 1000 metrics
+_MLFLOW_BATCH_LIMIT = 1000
+
+# Integrity report messages: n runs, mean m, std s, p the percent chance of being best
+_CHERRY_PICKING_WARNING = (
+    "WARNING: Reported value is the best out of {n} runs. "
+    "This has a {p:.1f}% probability by chance alone."
+)
+_VERDICT_INVALID = (
+    "INVALID: Reporting best of {n} is cherry-picking. "
+    "Report mean ({m:.4f}) and std ({s:.4f}) instead."
+)
+_VERDICT_VALID = "Valid with {n} experiments. Report: {m:.4f} +/- {s:.4f}"
+_VERDICT_SINGLE_RUN = "WARNING: Only 1 experiment. Run multiple seeds for statistical validity."
+
+
+class _RunningStats:
+    """
+    Single-pass count, mean, population variance, min and max.
+
+    Uses Welford's update, which stays accurate when the values are close
+    together (e.g. accuracies that differ in the fourth decimal). The values
+    themselves are kept in run order in a contiguous float64 column, and in
+    ascending order for rank lookups.
+    """
+
+    __slots__ = ("count", "mean", "m2", "min", "max", "_column", "ordered")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+        self._column = np.empty(16, dtype=np.float64)
+        self.ordered: List[float] = []
+
+    @property
+    def values(self) -> np.ndarray:
+        """The values pushed so far, in run order (a view, not a copy)."""
+        return self._column[: self.count]
+
+    def push(self, value: float) -> None:
+        """Fold one value into the statistics."""
+        if self.count == len(self._column):
+            # Double the capacity so appends stay amortized O(1)
+            grown = np.empty(2 * self.count, dtype=np.float64)
+            grown[: self.count] = self._column
+            self._column = grown
+        self._column[self.count] = value
+        insort(self.ordered, value)
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+
+    @property
+    def exact_mean(self) -> float:
+        """
+        Mean from a correctly rounded sum of the values.
+
+        Unlike the running ``mean``, this does not depend on the order the
+        runs finished in, so the same set of runs always reports the same mean.
+        """
+        return math.fsum(self.values) / self.count if self.count else 0.0
+
+    @property
+    def std(self) -> float:
+        """Population standard deviation (ddof=0)."""
+        return math.sqrt(self.m2 / self.count) if self.count else 0.0
+
+    def rank(self, value: float, tolerance: float = 1e-9) -> Optional[int]:
+        """
+        1-based rank of ``value`` among the values, largest first.
+
+        The match is the largest value within ``tolerance`` of ``value`` and
+        ties share the best rank; None when nothing is within ``tolerance``.
+        """
+        ordered = self.ordered
+        below = bisect_left(ordered, value + tolerance)
+        if below == 0 or ordered[below - 1] <= value - tolerance:
+            return None
+        return len(ordered) - bisect_right(ordered, ordered[below - 1]) + 1
+
+
+def _metric_value(value: Any) -> Optional[float]:
+    """``value`` as a float, or None for payloads such as strings, images or tables."""
+    if isinstance(value, (str, bytes)):
+        return None
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _fold_final_metrics(
+    aggregates: Dict[str, _RunningStats], final_metrics: Dict[str, float]
+) -> None:
+    """Add a finished run's final metric values to the per-metric aggregates."""
+    for key, value in final_metrics.items():
+        if value is None:
+            continue
+        stats = aggregates.get(key)
+        if stats is None:
+            stats = aggregates[key] = _RunningStats()
+        stats.push(value)
+
+
+def _step_thresholds(n: int, alpha: float = 0.05) -> Tuple[List[float], List[float]]:
+    """
+    Per-rank significance thresholds for ``n`` comparisons.
+
+    Returns the Holm-Bonferroni step-down alphas and the Benjamini-Hochberg
+    step-up thresholds, both ordered from the smallest p-value's rank upwards.
+    The tracker only sees metric values, not p-values, so these are the cut-offs
+    a caller compares its own ascending p-values against.
+    """
+    ranks = np.arange(1, n + 1, dtype=np.float64)
+    holm = alpha / (n - ranks + 1)
+    bh = alpha * ranks / n
+    return holm.tolist(), bh.tolist()
+
+
+def _compute_integrity_report(
+    metric_stats: Dict[str, _RunningStats],
+    seeds: List[Any],
+    metric_name: str,
+    reported_value: Optional[float],
+    include_values: bool,
+) -> Dict[str, Any]:
+    """Build the integrity report shared by the WandB and MLflow integrations."""
+    if not seeds:
+        return {"error": "No experiments tracked"}
+
+    # Statistics were accumulated as each run finished
+    stats = metric_stats.get(metric_name)
+    if stats is None:
+        return {"error": f"No values found for metric {metric_name}"}
+
+    n_experiments = stats.count
+    mean_val = stats.exact_mean
+    std_val = stats.std
+
+    report: Dict[str, Any] = {
+        "metric": metric_name,
+        "num_experiments": n_experiments,
+        "seeds_used": list(seeds),
+        "mean": mean_val,
+        "std": std_val,
+        "min": stats.min,
+        "max": stats.max,
+    }
+    if include_values:
+        report["all_values"] = stats.values.tolist()
+
+    # Bonferroni correction
+    report["bonferroni_factor"] = n_experiments
+    report["corrected_alpha"] = 0.05 / n_experiments
+    report["holm_alphas"], report["bh_thresholds"] = _step_thresholds(n_experiments)
+
+    # Cherry-picking analysis
+    if reported_value is not None:
+        # Binary search in the sorted values, with tolerance for float precision
+        rank = stats.rank(reported_value)
+
+        report["reported_value"] = reported_value
+        report["rank"] = rank
+        report["is_best"] = rank == 1
+
+        if rank == 1:
+            report["cherry_picking_warning"] = _CHERRY_PICKING_WARNING.format(
+                n=n_experiments, p=100 / n_experiments
+            )
+
+    # Verdict
+    if n_experiments > 10 and report.get("is_best", False):
+        report["verdict"] = _VERDICT_INVALID.format(n=n_experiments, m=mean_val, s=std_val)
+    elif n_experiments > 1:
+        report["verdict"] = _VERDICT_VALID.format(n=n_experiments, m=mean_val, s=std_val)
+    else:
+        report["verdict"] = _VERDICT_SINGLE_RUN
+
+    return report
 
 
 class WandBIntegration:
@@ -45,21 +245,43 @@ class WandBIntegration:
         report = tracker.get_integrity_report()
     """
 
-    def __init__(self, project: str, entity: Optional[str] = None) -> None:
+    def __init__(self, project: str, entity: Optional[str] = None, flush_every: int = 1) -> None:
         """
         Initialize WandB integration.
 
         Args:
             project: WandB project name
             entity: WandB entity (team/user)
+            flush_every: Buffer this many ``log`` calls before sending them to
+                wandb (1 sends every call immediately). Only consecutive calls
+                with the same explicit ``step`` are merged into one
+                ``wandb.log``; step-less calls are still sent one by one, just
+                later, so wandb's own timestamps for them lag. Use it when
+                several ``log`` calls share a step.
         """
         self.project = project
         self.entity = entity
+        self.flush_every = max(1, flush_every)
         self._run = None
+        # Try the import once here rather than on every run or log call
+        try:
+            import wandb
+
+            self._wandb: Any = wandb
+        except ImportError:
+            self._wandb = None
+        # Bound wandb.log of the active run, for the log hot path
+        self._wandb_log: Optional[Callable[..., Any]] = None
+        self._pending: List[Tuple[Dict[str, float], Optional[int]]] = []
         self._experiments: List[ExperimentMetadata] = []
         self._current_seed: Optional[int] = None
         self._current_config: Dict[str, Any] = {}
-        self._local_metrics: Dict[str, List[float]] = {}
+        # Latest tracked value per metric; becomes the run's final metrics
+        self._last_value: Dict[str, float] = {}
+        # Final values of finished runs, aggregated per metric
+        self._metric_stats: Dict[str, _RunningStats] = {}
+        # Seeds of finished runs in run order, kept as given (e.g. 128-bit entropy)
+        self._seeds: List[Any] = []
 
     def init(
         self, config: Optional[Dict[str, Any]] = None, seed: Optional[int] = None, **kwargs: Any
@@ -72,13 +294,21 @@ class WandBIntegration:
             seed: Random seed for reproducibility
             **kwargs: Additional wandb.init arguments
         """
+        # Buffered points belong to the previous run, so send them there first
+        if self._pending:
+            self._flush()
+
         self._current_config = config or {}
         self._current_seed = seed or self._current_config.get("seed", 0)
-        self._local_metrics = {}
+        self._last_value = {}
+        self._run = None
+        self._wandb_log = None
 
-        try:
-            import wandb
+        if self._wandb is None:
+            warnings.warn("wandb not installed. Running in local-only mode.")
+            return
 
+        try:
             # Add demyst metadata to config
             full_config = {
                 **self._current_config,
@@ -87,13 +317,11 @@ class WandBIntegration:
                 "demyst_timestamp": datetime.now().isoformat(),
             }
 
-            self._run = wandb.init(
+            self._run = self._wandb.init(
                 project=self.project, entity=self.entity, config=full_config, **kwargs
             )
+            self._wandb_log = self._wandb.log
 
-        except ImportError:
-            warnings.warn("wandb not installed. Running in local-only mode.")
-            self._run = None
         except Exception as e:
             warnings.warn(f"wandb initialization failed: {e}. Running in local-only mode.")
             self._run = None
@@ -106,18 +334,40 @@ class WandBIntegration:
             metrics: Dictionary of metrics to log
             step: Optional step number
         """
-        # Track locally for analysis
+        # Track numeric values locally for analysis; other payloads such as
+        # images or tables are only forwarded to wandb
         for key, value in metrics.items():
-            if key not in self._local_metrics:
-                self._local_metrics[key] = []
-            self._local_metrics[key].append(value)
+            number = _metric_value(value)
+            if number is not None:
+                self._last_value[key] = number
 
         # Log to wandb if available
-        if self._run is not None:
+        if self._run is not None and self._wandb_log is not None:
+            if self.flush_every == 1:
+                try:
+                    self._wandb_log(metrics, step=step)
+                except Exception as e:
+                    warnings.warn(f"Failed to log to wandb: {e}")
+            else:
+                self._pending.append((dict(metrics), step))
+                if len(self._pending) >= self.flush_every:
+                    self._flush()
+
+    def _flush(self) -> None:
+        """Send buffered metrics to wandb, merging consecutive calls for one step."""
+        batches: List[Tuple[Dict[str, float], Optional[int]]] = []
+        for metrics, step in self._pending:
+            if step is not None and batches and batches[-1][1] == step:
+                batches[-1][0].update(metrics)
+            else:
+                batches.append((metrics, step))
+        self._pending = []
+        if self._wandb_log is None:
+            return
+
+        for metrics, step in batches:
             try:
-                import wandb
-
-                wandb.log(metrics, step=step)
+                self._wandb_log(metrics, step=step)
             except Exception as e:
                 warnings.warn(f"Failed to log to wandb: {e}")
 
@@ -125,27 +375,32 @@ class WandBIntegration:
         """
         Finish the current run and record experiment metadata.
         """
+        if self._pending:
+            self._flush()
+
         # Record experiment
-        final_metrics = {k: v[-1] for k, v in self._local_metrics.items() if v}
+        final_metrics = self._last_value.copy()
 
-        run_id = self._run.id if self._run else f"local_{datetime.now().timestamp()}"
+        # One clock read serves both the record timestamp and a local run ID
+        finished_ns = time.time_ns()
+        run_id = self._run.id if self._run else f"local_{finished_ns}"
 
         experiment = ExperimentMetadata(
             run_id=run_id,
-            timestamp=datetime.now().isoformat(),
+            timestamp=datetime.fromtimestamp(finished_ns / 1e9).isoformat(),
             seed=self._current_seed or 0,
             config=self._current_config,
             metrics=final_metrics,
-            tags=["demyst_tracked"],
+            tags=_DEFAULT_TAGS,
         )
         self._experiments.append(experiment)
+        self._seeds.append(experiment.seed)
+        _fold_final_metrics(self._metric_stats, final_metrics)
 
         # Finish wandb run
         if self._run is not None:
             try:
-                import wandb
-
-                wandb.finish()
+                self._wandb.finish()
             except Exception:
                 pass
 
@@ -156,7 +411,10 @@ class WandBIntegration:
         return self._experiments
 
     def get_integrity_report(
-        self, metric_name: str = "accuracy", reported_value: Optional[float] = None
+        self,
+        metric_name: str = "accuracy",
+        reported_value: Optional[float] = None,
+        include_values: bool = True,
     ) -> Dict[str, Any]:
         """
         Generate a scientific integrity report.
@@ -164,82 +422,14 @@ class WandBIntegration:
         Args:
             metric_name: Name of the primary metric
             reported_value: Value being reported (for cherry-picking analysis)
+            include_values: Whether to list every run's value under "all_values"
 
         Returns:
             Integrity report with statistical corrections
         """
-        if not self._experiments:
-            return {"error": "No experiments tracked"}
-
-        # Collect metric values
-        values = []
-        for exp in self._experiments:
-            if metric_name in exp.metrics and exp.metrics[metric_name] is not None:
-                values.append(exp.metrics[metric_name])
-
-        if not values:
-            return {"error": f"No values found for metric {metric_name}"}
-
-        n_experiments = len(values)
-        mean_val = sum(values) / n_experiments
-        variance = sum((v - mean_val) ** 2 for v in values) / n_experiments
-        std_val = variance**0.5
-
-        # Seeds used
-        seeds = [exp.seed for exp in self._experiments]
-
-        report = {
-            "metric": metric_name,
-            "num_experiments": n_experiments,
-            "seeds_used": seeds,
-            "mean": mean_val,
-            "std": std_val,
-            "min": min(values),
-            "max": max(values),
-            "all_values": values,
-        }
-
-        # Bonferroni correction
-        report["bonferroni_factor"] = n_experiments
-        report["corrected_alpha"] = 0.05 / n_experiments
-
-        # Cherry-picking analysis
-        if reported_value is not None:
-            sorted_vals = sorted(values, reverse=True)
-            # Find rank with tolerance for float precision
-            rank = None
-            for i, val in enumerate(sorted_vals):
-                if abs(val - reported_value) < 1e-9:
-                    rank = i + 1
-                    break
-
-            report["reported_value"] = reported_value
-            report["rank"] = rank
-            report["is_best"] = rank == 1 if rank else False
-
-            if rank == 1:
-                report["cherry_picking_warning"] = (
-                    f"WARNING: Reported value is the best out of {n_experiments} runs. "
-                    f"This has a {100/n_experiments:.1f}% probability by chance alone."
-                )
-
-        # Verdict
-        if n_experiments > 10 and report.get("is_best", False):
-            report["verdict"] = (
-                f"INVALID: Reporting best of {n_experiments} is cherry-picking. "
-                f"Report mean ({mean_val:.4f}) and std ({std_val:.4f}) instead."
-            )
-        elif n_experiments > 1:
-            report["verdict"] = (
-                f"Valid with {n_experiments} experiments. Report: "
-                f"{mean_val:.4f} +/- {std_val:.4f}"
-            )
-        else:
-            report["verdict"] = (
-                "WARNING: Only 1 experiment. Run multiple seeds for statistical validity."
-            )
-
-        return report
+        return _compute_integrity_report(
+            self._metric_stats, self._seeds, metric_name, reported_value, include_values
+        )
 
 
 class MLflowIntegration:
@@ -260,21 +450,45 @@ class MLflowIntegration:
         report = tracker.get_integrity_report()
     """
 
-    def __init__(self, experiment_name: str, tracking_uri: Optional[str] = None) -> None:
+    def __init__(
+        self, experiment_name: str, tracking_uri: Optional[str] = None, flush_every: int = 1
+    ) -> None:
         """
         Initialize MLflow integration.
 
         Args:
             experiment_name: MLflow experiment name
             tracking_uri: MLflow tracking server URI
+            flush_every: Buffer this many metric values and send them with one
+                ``log_batch`` request (1 logs every value immediately)
         """
         self.experiment_name = experiment_name
         self.tracking_uri = tracking_uri
+        self.flush_every = max(1, flush_every)
+        # Try the import once here rather than on every run or log call, and
+        # keep the logging functions bound for the log hot path
+        self._mlflow_log_metric: Optional[Callable[..., Any]] = None
+        self._mlflow_log_metrics: Optional[Callable[..., Any]] = None
+        try:
+            import mlflow
+
+            self._mlflow: Any = mlflow
+            self._mlflow_log_metric = mlflow.log_metric
+            self._mlflow_log_metrics = mlflow.log_metrics
+        except ImportError:
+            self._mlflow = None
+        # (key, value, timestamp in ms, step) awaiting log_batch
+        self._pending: List[Tuple[str, float, int, int]] = []
         self._experiments: List[ExperimentMetadata] = []
         self._current_run_id: Optional[str] = None
         self._current_seed: int = 0
         self._current_params: Dict[str, Any] = {}
-        self._local_metrics: Dict[str, List[float]] = {}
+        # Latest tracked value per metric; becomes the run's final metrics
+        self._last_value: Dict[str, float] = {}
+        # Final values of finished runs, aggregated per metric
+        self._metric_stats: Dict[str, _RunningStats] = {}
+        # Seeds of finished runs in run order, kept as given (e.g. 128-bit entropy)
+        self._seeds: List[Any] = []
 
     def start_run(
         self, seed: int = 0, params: Optional[Dict[str, Any]] = None, run_name: Optional[str] = None
@@ -287,32 +501,35 @@ class MLflowIntegration:
             params: Run parameters
             run_name: Optional run name
         """
+        # Buffered points belong to the previous run, so send them there first
+        if self._pending:
+            self._flush()
+
         self._current_seed = seed
         self._current_params = params or {}
-        self._local_metrics = {}
+        self._last_value = {}
 
-        try:
-            import mlflow
+        mlflow = self._mlflow
+        if mlflow is None:
+            warnings.warn("mlflow not installed. Running in local-only mode.")
+            self._current_run_id = f"local_{time.time_ns()}"
+            return
 
-            if self.tracking_uri:
-                mlflow.set_tracking_uri(self.tracking_uri)
+        if self.tracking_uri:
+            mlflow.set_tracking_uri(self.tracking_uri)
 
-            mlflow.set_experiment(self.experiment_name)
-            run = mlflow.start_run(run_name=run_name)
-            self._current_run_id = run.info.run_id
+        mlflow.set_experiment(self.experiment_name)
+        run = mlflow.start_run(run_name=run_name)
+        self._current_run_id = run.info.run_id
 
-            # Log demyst metadata
-            mlflow.log_params(
-                {
-                    **self._current_params,
-                    "demyst_seed": seed,
-                    "demyst_tracked": True,
-                }
-            )
-
-        except ImportError:
-            warnings.warn("mlflow not installed. Running in local-only mode.")
-            self._current_run_id = f"local_{datetime.now().timestamp()}"
+        # Log demyst metadata
+        mlflow.log_params(
+            {
+                **self._current_params,
+                "demyst_seed": seed,
+                "demyst_tracked": True,
+            }
+        )
 
     def log_metric(self, key: str, value: float, step: Optional[int] = None) -> None:
         """
@@ -323,27 +540,73 @@ class MLflowIntegration:
             value: Metric value
             step: Optional step number
         """
-        if key not in self._local_metrics:
-            self._local_metrics[key] = []
-        self._local_metrics[key].append(value)
+        number = _metric_value(value)
+        if number is not None:
+            self._last_value[key] = number
+
+        if self.flush_every > 1:
+            if number is None:
+                warnings.warn(f"Failed to log to mlflow: {key}={value!r} is not numeric")
+                return
+            self._pending.append((key, number, int(time.time() * 1000), step or 0))
+            if len(self._pending) >= self.flush_every:
+                self._flush()
+            return
+
+        if self._mlflow_log_metric is not None:
+            try:
+                self._mlflow_log_metric(key, value, step=step)
+            except Exception as e:
+                warnings.warn(f"Failed to log to mlflow: {e}")
 
+    def _flush(self) -> None:
+        """Send buffered metric values to the active run with log_batch."""
+        pending, self._pending = self._pending, []
+        if self._mlflow is None:
+            return
         try:
-            import mlflow
-
-            mlflow.log_metric(key, value, step=step)
+            from mlflow.entities import Metric
+            from mlflow.tracking import MlflowClient
         except ImportError:
-            pass
+            return
+
+        try:
+            client = MlflowClient()
         except Exception as e:
             warnings.warn(f"Failed to log to mlflow: {e}")
+            return
+        metrics = [Metric(*entry) for entry in pending]
+        for start in range(0, len(metrics), _MLFLOW_BATCH_LIMIT):
+            try:
+                client.log_batch(
+                    self._current_run_id, metrics=metrics[start : start + _MLFLOW_BATCH_LIMIT]
+                )
+            except Exception as e:
+                warnings.warn(f"Failed to log to mlflow: {e}")
 
     def log_metrics(self, metrics: Dict[str, float], step: Optional[int] = None) -> None:
-        """Log multiple metrics."""
+        """Log multiple metrics, sent to mlflow in one call unless buffering."""
+        if self.flush_every > 1 or self._mlflow_log_metrics is None:
+            for key, value in metrics.items():
+                self.log_metric(key, value, step)
+            return
+
         for key, value in metrics.items():
-            self.log_metric(key, value, step)
+            number = _metric_value(value)
+            if number is not None:
+                self._last_value[key] = number
+
+        try:
+            self._mlflow_log_metrics(metrics, step=step)
+        except Exception as e:
+            warnings.warn(f"Failed to log to mlflow: {e}")
 
     def end_run(self) -> None:
         """End the current run."""
-        final_metrics = {k: v[-1] for k, v in self._local_metrics.items() if v}
+        if self._pending:
+            self._flush()
+
+        final_metrics = self._last_value.copy()
 
         experiment = ExperimentMetadata(
             run_id=self._current_run_id or "unknown",
@@ -351,16 +614,14 @@ class MLflowIntegration:
             seed=self._current_seed,
             config=self._current_params,
             metrics=final_metrics,
-            tags=["demyst_tracked"],
+            tags=_DEFAULT_TAGS,
         )
         self._experiments.append(experiment)
+        self._seeds.append(experiment.seed)
+        _fold_final_metrics(self._metric_stats, final_metrics)
 
-        try:
-            import mlflow
-
-            mlflow.end_run()
-        except ImportError:
-            pass
+        if self._mlflow is not None:
+            self._mlflow.end_run()
 
         self._current_run_id = None
 
@@ -369,63 +630,16 @@ class MLflowIntegration:
         return self._experiments
 
     def get_integrity_report(
-        self, metric_name: str = "accuracy", reported_value: Optional[float] = None
+        self,
+        metric_name: str = "accuracy",
+        reported_value: Optional[float] = None,
+        include_values: bool = True,
     ) -> Dict[str, Any]:
         """
         Generate a scientific integrity report.
 
         Identical interface to WandBIntegration for interoperability.
         """
-        if not self._experiments:
-            return {"error": "No experiments tracked"}
-
-        values = []
-        for exp in self._experiments:
-            if metric_name in exp.metrics and exp.metrics[metric_name] is not None:
-                values.append(exp.metrics[metric_name])
-
-        if not values:
-            return {"error": f"No values found for metric {metric_name}"}
-
-        n = len(values)
-        mean_val = sum(values) / n
-        variance = sum((v - mean_val) ** 2 for v in values) / n
-        std_val = variance**0.5
-
-        seeds = [exp.seed for exp in self._experiments]
-
-        report = {
-            "metric": metric_name,
-            "num_experiments": n,
-            "seeds_used": seeds,
-            "mean": mean_val,
-            "std": std_val,
-            "min": min(values),
-            "max": max(values),
-            "bonferroni_factor": n,
-            "corrected_alpha": 0.05 / n,
-        }
-
-        if reported_value is not None:
-            sorted_vals = sorted(values, reverse=True)
-            # Find rank with tolerance for float precision
-            rank = None
-            for i, val in enumerate(sorted_vals):
-                if abs(val - reported_value) < 1e-9:
-                    rank = i + 1
-                    break
-
-            if rank is not None:
-                report["rank"] = rank
-                report["is_best"] = rank == 1
-                if rank == 1:
-                    report["cherry_picking_warning"] = f"Reported best of {n} runs"
-
-        if n > 10 and report.get("is_best", False):
-            report["verdict"] = f"Cherry-picking detected. Report mean instead."
-        elif n > 1:
-            report["verdict"] = f"Valid: {mean_val:.4f} +/- {std_val:.4f} ({n} runs)"
-        else:
-            report["verdict"] = "Run multiple seeds for validity."
-
-        return report
+        return _compute_integrity_report(
+            self._metric_stats, self._seeds, metric_name, reported_value, include_values
+        )
@@ -6,8 +6,10 @@ Demyst Main Entry Point
 import os
 import sys
 
-# Add the current directory to Python path for imports
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# Add the package's parent directory to Python path for imports (once)
+_PKG_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _PKG_ROOT not in sys.path:
+    sys.path.insert(0, _PKG_ROOT)
 
 from demyst.__main__ import main
 
@@ -4,6 +4,7 @@ Demyst Test Configuration and Fixtures
 Provides shared fixtures for all test modules:
 - Path fixtures for project root and examples directory
 - Source code fixtures for each example file
+- Session-scoped sample files and snippets shared across tests
 - Guard instance fixtures (mirage_detector, hypothesis_guard, unit_guard)
 """
 
@@ -109,6 +110,22 @@ def chemistry_stoichiometry_source(chemistry_stoichiometry_path: Path) -> str:
     return chemistry_stoichiometry_path.read_text(encoding="utf-8")
 
 
+@pytest.fixture(scope="session")
+def suppressed_sample_file(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Return a session-wide file whose only mirage carries an inline suppression."""
+    file_path = tmp_path_factory.mktemp("samples") / "suppressed.py"
+    file_path.write_text(
+        "import numpy as np\nx = np.array([1, 2, 3])\nnp.mean(x)  # demyst: ignore-mirage\n"
+    )
+    return file_path
+
+
+@pytest.fixture(scope="session")
+def axis_keepdims_source() -> str:
+    """Return a snippet calling np.mean with axis and keepdims keyword arguments."""
+    return "import numpy as np\nresult = np.mean(x, axis=1, keepdims=True)\n"
+
+
 @pytest.fixture
 def mirage_detector():
     """Return a MirageDetector instance."""
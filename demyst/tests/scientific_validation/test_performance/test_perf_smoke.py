@@ -5,6 +5,7 @@ Goal: Ensure core guards handle moderately large code in reasonable time.
 This is intentionally loose to avoid flakiness; it guards against regressions.
 """
 
+import ast
 import time
 
 import pytest
@@ -21,12 +22,15 @@ class TestPerformanceSmoke:
         generator = SyntheticCodeGenerator(seed=123)
         code = generator.generate_large_file(num_lines=2000)
 
+        # Parse outside the timed region so only the detector is measured
+        tree = ast.parse(code)
+
         detector = MirageDetector()
-        start = time.perf_counter()
-        detector.analyze(__import__("ast").parse(code))
-        duration = time.perf_counter() - start
+        start_ns = time.perf_counter_ns()
+        detector.analyze(tree)
+        duration = (time.perf_counter_ns() - start_ns) / 1e9
 
-        # Allow generous threshold to avoid flakiness; regression guard only
+        # Generous threshold to avoid flakiness; regression guard only
         assert duration < 5.0, f"MirageDetector too slow: {duration:.2f}s"
 
     @pytest.mark.slow
@@ -36,8 +40,8 @@ class TestPerformanceSmoke:
         code = generator.generate_large_file(num_lines=1000)
 
         hunter = LeakageHunter()
-        start = time.perf_counter()
+        start_ns = time.perf_counter_ns()
         hunter.analyze(code)
-        duration = time.perf_counter() - start
+        duration = (time.perf_counter_ns() - start_ns) / 1e9
 
         assert duration < 5.0, f"LeakageHunter too slow: {duration:.2f}s"
@@ -5,7 +5,7 @@ Robustness under extreme conditions: nested calls, long lines, complexity.
 """
 
 import ast
-import textwrap
+import functools
 
 import pytest
 
@@ -13,21 +13,23 @@ from demyst.guards.tensor_guard import TensorGuard
 from demyst.guards.unit_guard import UnitGuard
 
 
+@functools.lru_cache(maxsize=None)
+def _nested_ast(depth: int, wrap: str = "f") -> ast.Module:
+    """Parse ``result = f(f(...f(x)...))`` once per depth."""
+    nested_call = f"{wrap}(" * depth + "x" + ")" * depth
+    return ast.parse(f"result = {nested_call}")
+
+
 class TestCodeComplexity:
 
     def test_deeply_nested_calls(self):
         """Test parsing and analysis of deeply nested function calls."""
         # f(f(f(...)))
-        depth = 200
-        nested_call = "x"
-        for _ in range(depth):
-            nested_call = f"f({nested_call})"
-
-        code = f"result = {nested_call}"
+        tree = _nested_ast(200)
 
         # UnitGuard tracks calls
         guard = UnitGuard()
-        result = guard.analyze(code)
+        result = guard.analyze_tree(tree)
 
         # Should not crash
         verdict = result["summary"]["verdict"]
@@ -36,7 +38,7 @@ class TestCodeComplexity:
     def test_extremely_long_lines(self):
         """Test extremely long lines (e.g. hardcoded data)."""
         # Generate a 100k char line
-        long_list = ",".join([str(i) for i in range(10000)])
+        long_list = ",".join(map(str, range(10000)))
         code = f"data = [{long_list}]"
 
         guard = TensorGuard()
@@ -48,15 +50,13 @@ class TestContentEdgeCases:
 
     def test_unicode_identifiers(self):
         """Test unicode math symbols in variable names."""
-        code = textwrap.dedent(
-            """
-            def physics_calc(α, β, Δt):
-                # Unicode variables
-                ω = α * β
-                θ = ω * Δt
-                return θ
-        """
-        )
+        code = """
+def physics_calc(α, β, Δt):
+    # Unicode variables
+    ω = α * β
+    θ = ω * Δt
+    return θ
+"""
 
         guard = UnitGuard()
         result = guard.analyze(code)
@@ -65,14 +65,12 @@ class TestContentEdgeCases:
 
     def test_complex_lambda_expressions(self):
         """Test lambda functions with complex logic."""
-        code = textwrap.dedent(
-            """
-            f = lambda x, y: (x**2 + y**2)**0.5 if x > 0 else 0
-            
-            # Nested lambdas
-            g = lambda a: (lambda b: a + b)(10)
-        """
-        )
+        code = """
+f = lambda x, y: (x**2 + y**2)**0.5 if x > 0 else 0
+
+# Nested lambdas
+g = lambda a: (lambda b: a + b)(10)
+"""
 
         guard = UnitGuard()
         result = guard.analyze(code)
@@ -4,6 +4,7 @@ Utilities for Scientific Validation Tests.
 Includes generators for synthetic large codebases and stress test patterns.
 """
 
+import hashlib
 import os
 import random
 import string
@@ -85,3 +86,32 @@ def process_data_{id}(df):
         with os.fdopen(fd, "w") as f:
             f.write(content)
         return Path(path)
+
+
+# Bump when SyntheticCodeGenerator output changes so stale cache entries are ignored
+_SYNTH_CACHE_VERSION = 1
+
+
+def cached_generate(seed: int, num_lines: int, cache_dir: Optional[Path] = None) -> str:
+    """
+    Return ``SyntheticCodeGenerator(seed).generate_large_file(num_lines)``.
+
+    Output is deterministic for a given seed and size, so when ``cache_dir``
+    is given it is stored there and read back on later sessions.
+    """
+    if cache_dir is None:
+        return SyntheticCodeGenerator(seed=seed).generate_large_file(num_lines)
+
+    key = hashlib.sha256(f"{_SYNTH_CACHE_VERSION}:{seed}:{num_lines}".encode()).hexdigest()
+    path = cache_dir / f"synth_{key[:16]}.py"
+    try:
+        return path.read_bytes().decode("utf-8")
+    except FileNotFoundError:
+        pass
+
+    content = SyntheticCodeGenerator(seed=seed).generate_large_file(num_lines)
+    # Write then rename so concurrent sessions never read a partial file
+    tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+    tmp_path.write_bytes(content.encode("utf-8"))
+    os.replace(tmp_path, path)
+    return content
@@ -315,6 +315,38 @@ def train_and_evaluate():
         assert "violations" in hypothesis_result
         assert "violations" in unit_result
 
+    def test_shared_instances_match_fresh_analysis(self):
+        """Shared guard instances reuse one object and match fresh results on a pre-parsed tree."""
+        from demyst.engine.mirage_detector import MirageDetector
+        from demyst.guards.hypothesis_guard import HypothesisGuard
+        from demyst.guards.leakage_hunter import LeakageHunter
+        from demyst.guards.tensor_guard import TensorGuard
+        from demyst.guards.unit_guard import UnitGuard
+
+        code = """
+import numpy as np
+from sklearn.preprocessing import StandardScaler
+from sklearn.model_selection import train_test_split
+
+X_scaled = StandardScaler().fit_transform(X)
+X_train, X_test = train_test_split(X_scaled)
+velocity = distance + time
+score = np.mean(np.array([1, 2, 3, 4]))
+"""
+        tree = ast.parse(code)
+
+        assert MirageDetector.shared() is MirageDetector.shared()
+        assert LeakageHunter.shared() is not TensorGuard.shared()
+
+        for _ in range(2):
+            assert MirageDetector.shared().analyze(tree) == MirageDetector().analyze(tree)
+            assert LeakageHunter.shared().analyze_tree(tree, code) == LeakageHunter().analyze(code)
+            assert HypothesisGuard.shared().analyze_tree(tree) == HypothesisGuard().analyze_code(
+                code
+            )
+            assert UnitGuard.shared().analyze_tree(tree) == UnitGuard().analyze(code)
+            assert TensorGuard.shared().analyze_tree(tree) == TensorGuard().analyze(code)
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
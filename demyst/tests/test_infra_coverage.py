@@ -1,11 +1,17 @@
+import difflib
+import json
+from pathlib import Path
+
 import pytest
 
+from demyst._json import dumps as json_dumps
 from demyst.engine.parallel import ParallelAnalyzer
 from demyst.exceptions import PluginValidationError
 from demyst.fixer import DemystFixer, fix_source
 from demyst.lazy import ImportManager, LazyModule, get_import_manager, import_time_report
 from demyst.plugins import GuardPlugin, PluginRegistry
 from demyst.red_team import RedTeamBenchmark
+from demyst.utils import TreeCache, load_tree, parse_source, safe_read_file, unified_diff
 
 
 class _SimpleGuard(GuardPlugin):
@@ -81,6 +87,75 @@ def test_parallel_analyzer_threads_basic(tmp_path):
     assert report.file_results[0].success
 
 
+def test_load_tree_memoizes_until_file_changes(tmp_path, monkeypatch):
+    sample = tmp_path / "sample.py"
+    sample.write_text("x = 1\n", encoding="utf-8")
+    source, tree = load_tree(str(sample))
+    assert source == "x = 1\n"
+    assert load_tree(str(sample))[1] is tree
+    # The second call must not re-read or re-parse the file
+    assert parse_source("x = 1\n") is not parse_source("x = 1\n")
+    with monkeypatch.context() as m:
+        m.setattr("demyst.utils.safe_read_file", lambda path: pytest.fail("re-read " + path))
+        assert load_tree(str(sample))[1] is tree
+
+    sample.write_text("x = 12\n", encoding="utf-8")
+    assert load_tree(str(sample))[0] == "x = 12\n"
+
+    sample.write_text("def broken(:\n", encoding="utf-8")
+    assert load_tree(str(sample))[1] is None
+
+
+def test_tree_cache_reuses_until_file_changes_and_evicts(tmp_path):
+    cache = TreeCache(maxsize=1)
+    first, second = tmp_path / "first.py", tmp_path / "second.py"
+    first.write_text("x = 1\n", encoding="utf-8")
+    second.write_text("y = 2\n", encoding="utf-8")
+
+    tree = load_tree(str(first), cache)[1]
+    assert load_tree(str(first), cache)[1] is tree
+
+    first.write_text("x = 12\n", encoding="utf-8")
+    assert load_tree(str(first), cache)[0] == "x = 12\n"
+
+    load_tree(str(second), cache)
+    assert list(cache._entries) == [str(second)]
+
+
+@pytest.mark.parametrize("mmap_min_bytes", [1 << 20, 1])
+def test_safe_read_file_matches_text_mode_open(tmp_path, monkeypatch, mmap_min_bytes):
+    monkeypatch.setattr("demyst.utils._MMAP_MIN_BYTES", mmap_min_bytes)
+    crlf = tmp_path / "crlf.py"
+    crlf.write_bytes(b"x = 1\r\ny = 2\rz = 3\n")
+    latin = tmp_path / "latin.py"
+    latin.write_bytes("name = 'Jos\u00e9'\n".encode("latin-1"))
+
+    assert safe_read_file(str(crlf)) == "x = 1\ny = 2\nz = 3\n"
+    assert safe_read_file(str(latin)) == "name = 'Jos\u00e9'\n"
+
+
+@pytest.mark.parametrize(
+    "after",
+    [
+        [],
+        ["line 0\n", "inserted\n"] + [f"line {i}\n" for i in range(1, 40)],
+        [f"line {i}\n" for i in range(40) if i not in (5, 30)] + ["tail\n"],
+        [f"line {i}\n" for i in range(40)],
+    ],
+)
+def test_unified_diff_matches_difflib(after):
+    before = [f"line {i}\n" for i in range(40)]
+    for lineterm in ("", "\n"):
+        expected = difflib.unified_diff(before, after, "original", "transformed", lineterm=lineterm)
+        actual = unified_diff(before, after, "original", "transformed", lineterm=lineterm)
+        assert "".join(actual) == "".join(expected)
+
+
+def test_json_dumps_matches_stdlib_report_format():
+    report = {"file": Path("a.py"), "issues": [{"line": 3, "score": 0.5}], "counts": {1: 2}}
+    assert json_dumps(report) == json.dumps(report, indent=2, default=str)
+
+
 def test_fix_source_cst_and_text_paths(tmp_path):
     source = "import numpy as np\nx = np.mean([1, 2, 3])\n"
     fixed, actions = fix_source(source, [{"type": "mean", "line": 2}], dry_run=True)
@@ -9,6 +9,10 @@ Tests:
 """
 
 import json
+import os
+import socket
+import threading
+import warnings
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -118,9 +122,17 @@ class TestExperimentTrackers:
         )
 
         assert report["num_experiments"] == 5
+        assert report["seeds_used"] == [42, 43, 44, 45, 46]
         assert report["bonferroni_factor"] == 5
+        assert report["holm_alphas"] == pytest.approx([0.01, 0.0125, 0.05 / 3, 0.025, 0.05])
+        assert report["bh_thresholds"] == pytest.approx([0.01, 0.02, 0.03, 0.04, 0.05])
         assert "mean" in report
         assert "std" in report
+        assert len(report["all_values"]) == 5
+
+        summary = tracker.get_integrity_report(metric_name="accuracy", include_values=False)
+        assert "all_values" not in summary
+        assert summary["mean"] == report["mean"]
 
     def test_mlflow_integration_local_mode(self):
         """Test MLflow integration in local-only mode."""
@@ -134,6 +146,194 @@ class TestExperimentTrackers:
         experiments = tracker.get_all_experiments()
         assert len(experiments) == 1
 
+    def test_mlflow_integrity_report_statistics(self):
+        """Report mean/std/min/max are the population statistics of final values."""
+        import statistics
+
+        from demyst.integrations.experiment_trackers import MLflowIntegration
+
+        tracker = MLflowIntegration(experiment_name="test-experiment")
+        values = [0.81, 0.79, 0.84, 0.8]
+        for seed, value in enumerate(values):
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore")
+                tracker.start_run(seed=seed)
+            tracker.log_metric("accuracy", value)
+            tracker.end_run()
+
+        report = tracker.get_integrity_report(metric_name="accuracy", reported_value=0.84)
+
+        assert report["mean"] == pytest.approx(statistics.fmean(values))
+        assert report["std"] == pytest.approx(statistics.pstdev(values))
+        assert (report["min"], report["max"]) == (0.79, 0.84)
+        assert report["rank"] == 1 and report["is_best"]
+
+        # Runs finished after a report are folded into the next one
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            tracker.start_run(seed=len(values))
+        tracker.log_metric("accuracy", 0.9)
+        tracker.end_run()
+        report = tracker.get_integrity_report(metric_name="accuracy", reported_value=0.84)
+        assert report["num_experiments"] == len(values) + 1
+        assert report["max"] == 0.9 and report["rank"] == 2
+
+    def test_wandb_local_metrics_skip_non_numeric_payloads(self):
+        """Non-numeric payloads are not tracked and do not break finish()."""
+        from demyst.integrations.experiment_trackers import WandBIntegration
+
+        tracker = WandBIntegration(project="test-project")
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            tracker.init(seed=1)
+        tracker.log({"accuracy": 1, "sample": "image.png"})
+        tracker.finish()
+
+        assert tracker.get_all_experiments()[0].metrics == {"accuracy": 1.0}
+        assert tracker.get_integrity_report()["mean"] == 1.0
+
+    def test_wandb_buffered_log_merges_same_step(self):
+        """With flush_every, buffered wandb.log calls for one step are merged."""
+        from demyst.integrations.experiment_trackers import WandBIntegration
+
+        fake_wandb = MagicMock()
+        with patch.dict("sys.modules", {"wandb": fake_wandb}):
+            tracker = WandBIntegration(project="test-project", flush_every=3)
+            tracker.init(seed=1)
+            tracker.log({"loss": 0.5}, step=0)
+            tracker.log({"accuracy": 0.8}, step=0)
+            assert not fake_wandb.log.called
+            tracker.log({"loss": 0.4}, step=1)
+            tracker.log({"loss": 0.3}, step=2)
+            tracker.finish()
+
+        assert [c.args[0] for c in fake_wandb.log.call_args_list] == [
+            {"loss": 0.5, "accuracy": 0.8},
+            {"loss": 0.4},
+            {"loss": 0.3},
+        ]
+        assert tracker.get_all_experiments()[0].metrics == {"loss": 0.3, "accuracy": 0.8}
+
+    def test_wandb_buffered_points_stay_with_their_run(self):
+        """init() flushes the previous run's buffer and one failed send drops nothing else."""
+        from demyst.integrations.experiment_trackers import WandBIntegration
+
+        fake_wandb = MagicMock()
+        fake_wandb.log.side_effect = [RuntimeError("offline"), None, None]
+        with patch.dict("sys.modules", {"wandb": fake_wandb}):
+            tracker = WandBIntegration(project="test-project", flush_every=3)
+            tracker.init(seed=1)
+            tracker.log({"loss": 1.0}, step=0)
+            tracker.log({"loss": 0.9}, step=1)
+            with pytest.warns(UserWarning, match="offline"):
+                tracker.init(seed=2)
+            tracker.log({"loss": 2.0}, step=0)
+            tracker.finish()
+
+        assert [c.args[0] for c in fake_wandb.log.call_args_list] == [
+            {"loss": 1.0},
+            {"loss": 0.9},
+            {"loss": 2.0},
+        ]
+
+    def test_mlflow_buffered_log_metric_warns_on_non_numeric(self):
+        """A non-numeric value warns in buffered mode instead of raising."""
+        from demyst.integrations.experiment_trackers import MLflowIntegration
+
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            tracker = MLflowIntegration(experiment_name="test-experiment", flush_every=3)
+            tracker.start_run(seed=1)
+        with pytest.warns(UserWarning, match="Failed to log to mlflow"):
+            tracker.log_metric("note", "abc")  # type: ignore[arg-type]
+        tracker.log_metric("loss", 0.5)
+        assert tracker._pending == [("loss", 0.5, tracker._pending[0][2], 0)]
+
+    def test_mlflow_log_metrics_sends_one_call(self):
+        """log_metrics hands the whole dict to mlflow.log_metrics once."""
+        from demyst.integrations.experiment_trackers import MLflowIntegration
+
+        fake_mlflow = MagicMock()
+        with patch.dict("sys.modules", {"mlflow": fake_mlflow}):
+            tracker = MLflowIntegration(experiment_name="test-experiment")
+            tracker.start_run(seed=1)
+        tracker.log_metrics({"loss": 0.5, "accuracy": 0.8}, step=3)
+        tracker.end_run()
+
+        fake_mlflow.log_metrics.assert_called_once_with({"loss": 0.5, "accuracy": 0.8}, step=3)
+        assert not fake_mlflow.log_metric.called
+        fake_mlflow.end_run.assert_called_once()
+        assert tracker.get_all_experiments()[0].metrics == {"loss": 0.5, "accuracy": 0.8}
+
+    def test_wandb_and_mlflow_reports_agree(self):
+        """Both trackers build the same integrity report from the same runs."""
+        from demyst.integrations.experiment_trackers import MLflowIntegration, WandBIntegration
+
+        wandb_tracker = WandBIntegration(project="test-project")
+        mlflow_tracker = MLflowIntegration(experiment_name="test-experiment")
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            for seed, accuracy in [(1, 0.81), (2, 0.84), (3, 0.79)]:
+                wandb_tracker.init(seed=seed)
+                wandb_tracker.log({"accuracy": accuracy})
+                wandb_tracker.finish()
+                mlflow_tracker.start_run(seed=seed)
+                mlflow_tracker.log_metric("accuracy", accuracy)
+                mlflow_tracker.end_run()
+
+        wandb_report = wandb_tracker.get_integrity_report("accuracy", 0.84)
+        assert wandb_report == mlflow_tracker.get_integrity_report("accuracy", 0.84)
+        assert wandb_report["rank"] == 1
+
+    def test_reports_keep_large_and_non_int_seeds(self):
+        """Seeds are reported as given, including 128-bit SeedSequence entropy."""
+        from demyst.integrations.experiment_trackers import MLflowIntegration, WandBIntegration
+
+        seeds = [2**127 + 5, "42", 7]
+        wandb_tracker = WandBIntegration(project="test-project")
+        mlflow_tracker = MLflowIntegration(experiment_name="test-experiment")
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            for seed in seeds:
+                wandb_tracker.init(seed=seed)
+                wandb_tracker.log({"accuracy": 0.9})
+                wandb_tracker.finish()
+                mlflow_tracker.start_run(seed=seed)  # type: ignore[arg-type]
+                mlflow_tracker.log_metric("accuracy", 0.9)
+                mlflow_tracker.end_run()
+
+        for tracker in (wandb_tracker, mlflow_tracker):
+            report = tracker.get_integrity_report("accuracy")
+            assert report["seeds_used"] == seeds
+            assert report["num_experiments"] == 3
+
+    def test_running_stats_is_stable_for_close_values(self):
+        """Welford statistics match exact ones when values share a large offset."""
+        import statistics
+
+        from demyst.integrations.experiment_trackers import _RunningStats
+
+        values = [1e6 + 0.9421, 1e6 + 0.9423, 1e6 + 0.9419, 1e6 + 0.9425]
+        stats = _RunningStats()
+        for value in values:
+            stats.push(value)
+
+        assert stats.std == pytest.approx(statistics.pstdev(values), rel=1e-5)
+        assert (stats.min, stats.max) == (min(values), max(values))
+
+    def test_running_stats_exact_mean_ignores_run_order(self):
+        """The reported mean is correctly rounded whatever order runs finish in."""
+        import math
+
+        from demyst.integrations.experiment_trackers import _RunningStats
+
+        values = [1e8 + 0.1, 0.3, -1e8]
+        for ordering in (values, values[::-1]):
+            stats = _RunningStats()
+            for value in ordering:
+                stats.push(value)
+            assert stats.exact_mean == math.fsum(values) / len(values)
+
     @pytest.mark.skipif(not WANDB_AVAILABLE, reason="wandb not available or import error")
     def test_cherry_picking_detection(self):
         """Test cherry-picking detection in experiment tracker."""
@@ -191,6 +391,220 @@ def calculate_mean(data):
         assert "tensor" in result
         assert "leakage" in result
 
+    def test_pooled_guards_do_not_leak_between_files(self, tmp_path):
+        """Reused guard instances report each file independently."""
+        from demyst.integrations.ci_enforcer import CIEnforcer
+
+        mirage = tmp_path / "mirage.py"
+        mirage.write_text("import numpy as np\n\ndef f(data):\n    return np.mean(data)\n")
+        clean = tmp_path / "clean.py"
+        clean.write_text("def add(a, b):\n    return a + b\n")
+
+        enforcer = CIEnforcer()
+        first = enforcer.analyze_file(str(mirage))
+        detector = enforcer._pooled_guard("mirage", enforcer.MirageDetector)
+
+        assert enforcer.analyze_file(str(clean))["mirage"]["issues"] == []
+        assert enforcer._pooled_guard("mirage", enforcer.MirageDetector) is detector
+        assert first["mirage"]["issues"][0]["type"] == "mean"
+
+    def test_tensor_triage_skips_only_irrelevant_files(self, tmp_path):
+        """Files without tensor-guard triggers get the same empty tensor result."""
+        from demyst.guards.tensor_guard import TensorGuard
+        from demyst.integrations.ci_enforcer import CIEnforcer
+
+        plain = tmp_path / "plain.py"
+        plain.write_text("def add(a, b):\n    return a + b\n")
+        reward = tmp_path / "reward.py"
+        reward.write_text("def compute_reward(r):\n    return r.mean()\n")
+
+        enforcer = CIEnforcer()
+        assert enforcer.analyze_file(str(plain))["tensor"] == TensorGuard().analyze("")
+        assert enforcer.analyze_file(str(reward))["tensor"]["reward_issues"]
+
+    def test_parallel_directory_analysis_matches_sequential(self, tmp_path):
+        """Process-pool directory analysis reports the same issues as sequential."""
+        from demyst.integrations.ci_enforcer import _PARALLEL_MIN_FILES, CIEnforcer
+
+        for i in range(_PARALLEL_MIN_FILES):
+            sub = tmp_path / f"pkg{i % 3}"
+            sub.mkdir(exist_ok=True)
+            (sub / f"mod{i}.py").write_text(
+                f"import numpy as np\n\ndef f{i}(data):\n    return np.mean(data)\n"
+            )
+
+        # pytest's tmp_path contains "test_", which the default ignores match
+        options = {"exclude_patterns": ["**/__pycache__/**"]}
+        enforcer = CIEnforcer()
+        sequential = enforcer.analyze_directory(str(tmp_path), max_workers=1, **options)
+        parallel = enforcer.analyze_directory(str(tmp_path), max_workers=2, **options)
+
+        assert parallel.files_analyzed == _PARALLEL_MIN_FILES
+        assert parallel.to_dict()["checks"] == sequential.to_dict()["checks"]
+
+    @pytest.mark.parametrize("root", [".", "proj"])
+    def test_directory_pruning_matches_exclude_patterns(self, tmp_path, monkeypatch, root):
+        """Pruned directories are exactly those the exclude patterns would filter out."""
+        from demyst.integrations import ci_enforcer
+
+        for rel in ["tests/a.py", "venv/v.py", "src/b.py", "src/tests/c.py"]:
+            path = tmp_path / "proj" / rel
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text("x = 1\n")
+        monkeypatch.chdir(tmp_path / "proj" if root == "." else tmp_path)
+
+        def analyzed_files():
+            report = ci_enforcer.CIEnforcer().analyze_directory(root, max_workers=1)
+            return report.files_analyzed
+
+        pruned = analyzed_files()
+        monkeypatch.setattr(ci_enforcer, "_pruned_dir_names", lambda patterns: frozenset())
+        assert pruned == analyzed_files()
+        # "**/tests/**" needs a "/" before the name, so top-level tests/ and
+        # venv/ are analyzed under a "." root but not under "proj"
+        assert pruned == (3 if root == "." else 1)
+
+    def test_demystignore_excludes_files_and_directories(self, tmp_path):
+        """Paths listed in .demystignore are skipped by directory analysis."""
+        from demyst.integrations.ci_enforcer import CIEnforcer
+
+        for rel in ["keep.py", "gen_pb2.py", "generated/a.py", "pkg/generated/b.py", "pkg/c.py"]:
+            path = tmp_path / rel
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text("x = 1\n")
+        (tmp_path / ".demystignore").write_text("# generated code\ngenerated/\n*_pb2.py\n")
+
+        report = CIEnforcer().analyze_directory(
+            str(tmp_path), exclude_patterns=["**/__pycache__/**"], max_workers=1
+        )
+
+        assert report.files_analyzed == 2
+
+    @pytest.mark.skipif(not hasattr(socket, "AF_UNIX"), reason="needs Unix domain sockets")
+    def test_daemon_answers_each_path_with_json(self, tmp_path):
+        """The CI daemon returns one analyze_file result per request line."""
+        from demyst.integrations.ci_daemon import CIDaemon
+
+        target = tmp_path / "calc.py"
+        target.write_text("import numpy as np\n\ndef f(data):\n    return np.mean(data)\n")
+        socket_path = str(tmp_path / "demyst.sock")
+
+        daemon = CIDaemon(socket_path)
+        assert daemon.enforcer.tree_cache is not None
+        server = threading.Thread(target=daemon.serve_forever)
+        server.start()
+        try:
+            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+                sock.connect(socket_path)
+                with sock.makefile("rwb") as stream:
+                    stream.write(b"\xff\xfe.py\n" + f"{target}\n".encode("utf-8"))
+                    stream.flush()
+                    bad_line = json.loads(stream.readline())
+                    result = json.loads(stream.readline())
+        finally:
+            daemon.shutdown()
+            daemon.server_close()
+            server.join()
+
+        assert "error" in bad_line
+        assert result["filepath"] == str(target)
+        assert result["mirage"]["issues"][0]["type"] == "mean"
+        assert not os.path.exists(socket_path)
+
+    @pytest.mark.skipif(not hasattr(socket, "AF_UNIX"), reason="needs Unix domain sockets")
+    def test_daemon_only_replaces_stale_sockets(self, tmp_path):
+        """A dead daemon's socket is reused; files and live sockets are left alone."""
+        from demyst.integrations.ci_daemon import CIDaemon
+
+        not_a_socket = tmp_path / "notes.txt"
+        not_a_socket.write_text("keep me\n")
+        with pytest.raises(FileExistsError, match="not a socket"):
+            CIDaemon(str(not_a_socket))
+        assert not_a_socket.read_text() == "keep me\n"
+
+        socket_path = str(tmp_path / "demyst.sock")
+        stale = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        stale.bind(socket_path)
+        stale.close()
+
+        daemon = CIDaemon(socket_path)
+        try:
+            assert os.stat(socket_path).st_mode & 0o777 == 0o600
+            with pytest.raises(FileExistsError, match="already listening"):
+                CIDaemon(socket_path)
+            assert os.path.exists(socket_path)
+        finally:
+            daemon.server_close()
+
+    @pytest.mark.skipif(not hasattr(socket, "AF_UNIX"), reason="needs Unix domain sockets")
+    def test_default_socket_path_is_per_user(self, tmp_path, monkeypatch):
+        """The default socket never lands on a name shared by every user."""
+        from demyst.integrations.ci_daemon import _default_socket_path
+
+        monkeypatch.setenv("XDG_RUNTIME_DIR", str(tmp_path))
+        assert _default_socket_path() == str(tmp_path / "demyst.sock")
+        monkeypatch.delenv("XDG_RUNTIME_DIR")
+        assert os.path.basename(_default_socket_path()) == f"demyst-{os.getuid()}.sock"
+
+    @pytest.mark.skipif(not hasattr(socket, "AF_UNIX"), reason="needs Unix domain sockets")
+    def test_client_exit_code_follows_replies(self, tmp_path, monkeypatch, capsys):
+        """demyst-client resolves paths locally and fails on blocking issues or no daemon."""
+        import io
+
+        from demyst.integrations.ci_daemon import CIDaemon, client_main
+
+        (tmp_path / "clean.py").write_text("x = 1\n")
+        (tmp_path / "calc.py").write_text(
+            "import numpy as np\n\ndef f(data):\n    return np.mean(data)\n"
+        )
+        socket_path = str(tmp_path / "demyst.sock")
+        monkeypatch.chdir(tmp_path)
+
+        monkeypatch.setattr("sys.stdin", io.StringIO("clean.py\n"))
+        assert client_main(["--socket", socket_path]) == 1
+        assert "no demyst daemon on" in capsys.readouterr().err
+
+        daemon = CIDaemon(socket_path)
+        server = threading.Thread(target=daemon.serve_forever)
+        server.start()
+        try:
+            monkeypatch.setattr("sys.stdin", io.StringIO("clean.py\n"))
+            assert client_main(["--socket", socket_path]) == 0
+            reply = json.loads(capsys.readouterr().out)
+            assert reply["filepath"] == str(tmp_path / "clean.py")
+
+            monkeypatch.setattr("sys.stdin", io.StringIO("clean.py\ncalc.py\n"))
+            assert client_main(["--socket", socket_path]) == 1
+        finally:
+            daemon.shutdown()
+            daemon.server_close()
+            server.join()
+
+    @pytest.mark.skipif(not hasattr(socket, "AF_UNIX"), reason="needs Unix domain sockets")
+    def test_client_fails_when_daemon_hangs_up(self, tmp_path, monkeypatch, capsys):
+        """demyst-client exits non-zero instead of printing nothing on EOF."""
+        import io
+
+        from demyst.integrations.ci_daemon import client_main
+
+        socket_path = str(tmp_path / "demyst.sock")
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as listener:
+            listener.bind(socket_path)
+            listener.listen(1)
+
+            def hang_up():
+                conn, _ = listener.accept()
+                conn.recv(1024)
+                conn.close()
+
+            server = threading.Thread(target=hang_up)
+            server.start()
+            monkeypatch.setattr("sys.stdin", io.StringIO("calc.py\n"))
+            assert client_main(["--socket", socket_path]) == 1
+            server.join()
+
+        assert "closed the connection" in capsys.readouterr().err
+
     def test_report_generation(self):
         """Test report generation."""
         from demyst.integrations.ci_enforcer import IntegrityCheck, ScientificIntegrityReport
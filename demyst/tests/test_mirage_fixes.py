@@ -1,14 +1,25 @@
 import ast
+import functools
 from pathlib import Path
 
 from demyst.engine.cst_transformer import CSTTranspiler
 from demyst.engine.mirage_detector import MirageDetector
 from demyst.engine.parallel import _analyze_file_worker
+from demyst.engine.transpiler import Transpiler
 
 
-def test_cst_preserves_axis_keepdims(tmp_path: Path) -> None:
-    source = "import numpy as np\nresult = np.mean(x, axis=1, keepdims=True)\n"
-    transformed = CSTTranspiler().transpile_source(source)
+@functools.lru_cache(maxsize=None)
+def _parsed(source: str) -> ast.Module:
+    return ast.parse(source)
+
+
+@functools.lru_cache(maxsize=None)
+def _transpiled(source: str) -> str:
+    return CSTTranspiler().transpile_source(source)
+
+
+def test_cst_preserves_axis_keepdims(axis_keepdims_source: str) -> None:
+    transformed = _transpiled(axis_keepdims_source)
 
     assert "VariationTensor" in transformed
     assert ("axis=1" in transformed) or ("axis = 1" in transformed)
@@ -18,7 +29,7 @@ def test_cst_preserves_axis_keepdims(tmp_path: Path) -> None:
 
 def test_cst_transforms_argmax() -> None:
     source = "import numpy as np\nval = np.argmax(x)\n"
-    transformed = CSTTranspiler().transpile_source(source)
+    transformed = _transpiled(source)
 
     assert "VariationTensor" in transformed
     assert ".collapse('argmax')" in transformed
@@ -26,20 +37,37 @@ def test_cst_transforms_argmax() -> None:
 
 def test_cst_discretization_wrapper() -> None:
     source = "val = int(x)\n"
-    transformed = CSTTranspiler().transpile_source(source)
+    transformed = _transpiled(source)
 
     assert "VariationTensor" in transformed
     assert ".discretize('int')" in transformed
 
 
-def test_parallel_respects_inline_suppression(tmp_path: Path) -> None:
-    code = "import numpy as np\nx = np.array([1, 2, 3])\nnp.mean(x)  # demyst: ignore-mirage\n"
-    file_path = tmp_path / "suppressed.py"
-    file_path.write_text(code)
+def test_ast_backend_patches_only_mirage_spans() -> None:
+    source = (
+        "import numpy as np  # numerics\n"
+        "\n"
+        "def f(a):\n"
+        "    # keep this comment\n"
+        "    return np.mean(np.sum(a,\n"
+        "                          axis=1))\n"
+    )
+    transformed = Transpiler(use_cst=False).transpile_source(source)
+
+    assert transformed == (
+        "import numpy as np  # numerics\n"
+        "from demyst.engine.variation_tensor import VariationTensor\n"
+        "\n"
+        "def f(a):\n"
+        "    # keep this comment\n"
+        "    return VariationTensor(VariationTensor(a).ensemble_sum(1)).collapse('mean')\n"
+    )
+
 
+def test_parallel_respects_inline_suppression(suppressed_sample_file: Path) -> None:
     result = _analyze_file_worker(
         (
-            str(file_path),
+            str(suppressed_sample_file),
             {
                 "mirage": True,
                 "leakage": False,
@@ -63,7 +91,7 @@ def analyze(values):
     return mu / sigma
 """
     detector = MirageDetector()
-    tree = ast.parse(code)
+    tree = _parsed(code)
     issues = detector.analyze(tree, source=code)
 
     # Variance context should suppress the mean mirage
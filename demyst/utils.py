@@ -1,22 +1,224 @@
+import ast
+import difflib
+import functools
 import logging
+import mmap
+import os
 import sys
+from collections import OrderedDict
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Type, TypeVar
 
 logger = logging.getLogger("demyst")
 
+_S = TypeVar("_S", bound="SharedInstanceMixin")
 
-def safe_read_file(path: str) -> str:
-    """Safely read a file with proper error handling."""
+try:
+    from cdifflib import CSequenceMatcher as _SequenceMatcher
+except ImportError:
+    _SequenceMatcher = difflib.SequenceMatcher
+
+
+class SharedInstanceMixin:
+    """
+    Give an analyzer class a lazily created, process-wide default instance.
+
+    ``shared()`` returns the same default-config instance on every call and
+    clears its per-run state first, so repeated analyses skip construction.
+    Subclasses override ``reset()`` to clear whatever state they accumulate.
+    """
+
+    # Empty so subclasses that declare __slots__ get no instance __dict__
+    __slots__ = ()
+
+    _shared_instances: Dict[type, Any] = {}
+
+    @classmethod
+    def shared(cls: Type[_S]) -> _S:
+        instance = SharedInstanceMixin._shared_instances.get(cls)
+        if instance is None:
+            instance = cls()
+            SharedInstanceMixin._shared_instances[cls] = instance
+        instance.reset()
+        return instance
+
+    def reset(self) -> None:
+        """Clear per-run state so the instance can be reused."""
+
+
+# Files at least this large are decoded straight out of a read-only memory
+# map instead of being copied into an intermediate bytes object first
+_MMAP_MIN_BYTES = 1 << 20
+
+
+def _decode_source(data: Any, path: str) -> str:
     try:
-        with open(path, "r", encoding="utf-8") as f:
-            return f.read()
+        return str(data, "utf-8")
     except UnicodeDecodeError:
         # Try with latin-1 as fallback
         logger.debug(f"UTF-8 decode failed for {path}, trying latin-1")
-        with open(path, "r", encoding="latin-1") as f:
-            return f.read()
+        return str(data, "latin-1")
+
+
+def safe_read_file(path: str) -> str:
+    """Safely read a file with proper error handling."""
+    try:
+        with open(path, "rb") as f:
+            if os.fstat(f.fileno()).st_size >= _MMAP_MIN_BYTES:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                    text = _decode_source(data, path)
+            else:
+                text = _decode_source(f.read(), path)
     except FileNotFoundError:
         raise FileNotFoundError(f"File not found: {path}")
     except PermissionError:
         raise PermissionError(f"Permission denied: {path}")
     except IsADirectoryError:
         raise IsADirectoryError(f"Expected a file, got a directory: {path}")
+
+    # Same universal-newline translation text-mode open() applies
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
+
+
+def parse_source(source: str, filename: str = "<unknown>") -> ast.Module:
+    """
+    Parse source to a module AST.
+
+    Same tree as ``ast.parse(source)`` (type comments stay off), compiled
+    directly without the wrapper and without inheriting the caller's
+    ``__future__`` flags. Syntax errors name ``filename``.
+    """
+    tree: ast.Module = compile(
+        source, filename, "exec", flags=ast.PyCF_ONLY_AST, dont_inherit=True, optimize=0
+    )
+    return tree
+
+
+def _read_tree(path: str) -> Tuple[str, Optional[ast.Module]]:
+    source = safe_read_file(path)
+    try:
+        tree: Optional[ast.Module] = parse_source(source, path)
+    except (SyntaxError, ValueError):
+        tree = None
+    return source, tree
+
+
+# Small on purpose: it only has to cover back-to-back reads of the same file
+# (analysis followed by per-issue reporting). A directory scan reads each file
+# once, so a larger default would just keep ASTs alive in every worker.
+@functools.lru_cache(maxsize=4)
+def _load_tree(path: str, mtime_ns: int, size: int) -> Tuple[str, Optional[ast.Module]]:
+    return _read_tree(path)
+
+
+class TreeCache:
+    """
+    Least-recently-used cache of parsed files for long-lived processes.
+
+    Entries are keyed on path and invalidated when the file's mtime or size
+    changes. Pass one to ``load_tree`` (or ``CIEnforcer``) when the same files
+    are analyzed repeatedly, as in the CI daemon.
+    """
+
+    __slots__ = ("maxsize", "_entries")
+
+    def __init__(self, maxsize: int = 128) -> None:
+        self.maxsize = maxsize
+        # path -> ((mtime_ns, size), (source, tree)), least recently used first
+        self._entries: "OrderedDict[str, Tuple[Tuple[int, int], Any]]" = OrderedDict()
+
+    def load(self, path: str) -> Tuple[str, Optional[ast.Module]]:
+        """Return ``load_tree(path)``, re-reading only if the file changed."""
+        st = os.stat(path)
+        key = (st.st_mtime_ns, st.st_size)
+        entry = self._entries.get(path)
+        if entry is not None and entry[0] == key:
+            self._entries.move_to_end(path)
+            return entry[1]
+        result = _read_tree(path)
+        self._entries[path] = (key, result)
+        self._entries.move_to_end(path)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+        return result
+
+
+def load_tree(path: str, cache: Optional[TreeCache] = None) -> Tuple[str, Optional[ast.Module]]:
+    """
+    Read and parse a Python file, memoized on its path, mtime and size.
+
+    Returns ``(source, tree)``; ``tree`` is None when the source does not
+    parse, so callers can fall back to their own error reporting. The tree
+    is shared between callers and must not be structurally modified.
+    Without ``cache`` only the last few files are memoized.
+    """
+    if cache is not None:
+        return cache.load(path)
+    st = os.stat(path)
+    return _load_tree(path, st.st_mtime_ns, st.st_size)
+
+
+def _format_range(start: int, stop: int) -> str:
+    # Same hunk range notation as difflib.unified_diff
+    length = stop - start
+    if length == 1:
+        return str(start + 1)
+    return f"{start + 1 if length else start},{length}"
+
+
+def unified_diff(
+    a: List[str],
+    b: List[str],
+    fromfile: str = "",
+    tofile: str = "",
+    n: int = 3,
+    lineterm: str = "\n",
+) -> Iterator[str]:
+    """
+    ``difflib.unified_diff`` replacement tuned for small edits to long files.
+
+    Lines shared at the head and tail of both inputs are trimmed (keeping
+    ``n`` lines of context) before matching, and the matcher is cdifflib's C
+    implementation when that package is installed.
+
+    The output uses the same headers, hunk ranges and line prefixes as
+    difflib and always turns ``a`` into ``b``, but it is not always identical
+    to difflib's output. When lines repeat (blank lines, closing brackets),
+    matching only the trimmed region can pair a line with a different copy
+    of itself than difflib would, so the hunk layout may differ. When every
+    line in each input is distinct, the output is identical.
+    """
+    limit = min(len(a), len(b))
+    head = 0
+    while head < limit and a[head] == b[head]:
+        head += 1
+    tail = 0
+    while tail < limit - head and a[-1 - tail] == b[-1 - tail]:
+        tail += 1
+
+    lo = max(0, head - n)
+    trim = max(0, tail - n)
+    matcher = _SequenceMatcher(None, a[lo : len(a) - trim], b[lo : len(b) - trim])
+
+    started = False
+    for group in matcher.get_grouped_opcodes(n):
+        if not started:
+            started = True
+            yield f"--- {fromfile}{lineterm}"
+            yield f"+++ {tofile}{lineterm}"
+        first, last = group[0], group[-1]
+        old_range = _format_range(first[1] + lo, last[2] + lo)
+        new_range = _format_range(first[3] + lo, last[4] + lo)
+        yield f"@@ -{old_range} +{new_range} @@{lineterm}"
+        for tag, i1, i2, j1, j2 in group:
+            if tag == "equal":
+                for line in a[lo + i1 : lo + i2]:
+                    yield " " + line
+                continue
+            if tag in ("replace", "delete"):
+                for line in a[lo + i1 : lo + i2]:
+                    yield "-" + line
+            if tag in ("replace", "insert"):
+                for line in b[lo + j1 : lo + j2]:
+                    yield "+" + line
@@ -1,5 +1,7 @@
+import io
+import sys
+
 import numpy as np
-from scipy.stats import ttest_ind
 
 
 def analyze_gene_expression(num_genes=1000):
@@ -7,23 +9,36 @@ def analyze_gene_expression(num_genes=1000):
     Analyze differential gene expression.
     Contains p-hacking patterns that Demyst detects.
     """
+    # scipy.stats is heavy to import; only pay for it when the analysis runs
+    from scipy.stats import ttest_ind
+
     print(f"Analyzing {num_genes} genes...")
 
-    significant_genes = []
+    p_vals = np.empty(num_genes)
+    report = io.StringIO()
 
     # Simulate gene expression data
     # Null hypothesis: No difference between control and treatment
-    control_group = np.random.normal(10, 2, (num_genes, 10))
-    treatment_group = np.random.normal(10, 2, (num_genes, 10))
+    rng = np.random.default_rng(0)
+    control_group = 10 + 2 * rng.standard_normal((num_genes, 10))
+    treatment_group = 10 + 2 * rng.standard_normal((num_genes, 10))
 
     # ERROR: Multiple comparisons without correction
     for gene_idx in range(num_genes):
         # Run t-test for each gene
         t_stat, p_val = ttest_ind(control_group[gene_idx], treatment_group[gene_idx])
+        p_vals[gene_idx] = p_val
 
         # ERROR: Conditional reporting / P-hacking
         if p_val < 0.05:
-            print(f"Gene_{gene_idx} is SIGNIFICANT! (p={p_val:.4f})")
-            significant_genes.append(gene_idx)
+            print(f"Gene_{gene_idx} is SIGNIFICANT! (p={p_val:.4f})", file=report)
+
+    # Flush the buffered report in a single write
+    sys.stdout.write(report.getvalue())
+
+    significant_genes = np.flatnonzero(p_vals < 0.05)
+    return significant_genes.tolist()
+
 
-    return significant_genes
+if __name__ == "__main__":
+    analyze_gene_expression()
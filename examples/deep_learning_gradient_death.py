@@ -39,13 +39,8 @@ class DeepSigmoidNetwork(nn.Module):
     def __init__(self, input_dim=100, hidden_dim=50, num_layers=10):
         super().__init__()
 
-        self.layers = nn.ModuleList()
-        self.layers.append(nn.Linear(input_dim, hidden_dim))
-
-        for _ in range(num_layers - 2):
-            self.layers.append(nn.Linear(hidden_dim, hidden_dim))
-
-        self.layers.append(nn.Linear(hidden_dim, 10))
+        dims = [input_dim] + [hidden_dim] * (num_layers - 1) + [10]
+        self.layers = nn.ModuleList(nn.Linear(i, o) for i, o in zip(dims[:-1], dims[1:]))
 
         # ERROR: Using Sigmoid everywhere
         self.activation = nn.Sigmoid()  # TensorGuard flags this pattern
@@ -75,11 +70,8 @@ class DeepTanhNetwork(nn.Module):
     def __init__(self, input_dim=100, hidden_dim=50, num_layers=8):
         super().__init__()
 
-        self.layers = nn.ModuleList()
-        for i in range(num_layers):
-            in_features = input_dim if i == 0 else hidden_dim
-            out_features = 10 if i == num_layers - 1 else hidden_dim
-            self.layers.append(nn.Linear(in_features, out_features))
+        dims = [input_dim] + [hidden_dim] * (num_layers - 1) + [10]
+        self.layers = nn.ModuleList(nn.Linear(i, o) for i, o in zip(dims[:-1], dims[1:]))
 
         self.activation = nn.Tanh()  # TensorGuard: 4+ Tanh in chain
 
@@ -175,11 +167,8 @@ class ModernActivationNetwork(nn.Module):
     def __init__(self, input_dim=100, hidden_dim=50, num_layers=10):
         super().__init__()
 
-        self.layers = nn.ModuleList()
-        for i in range(num_layers):
-            in_features = input_dim if i == 0 else hidden_dim
-            out_features = 10 if i == num_layers - 1 else hidden_dim
-            self.layers.append(nn.Linear(in_features, out_features))
+        dims = [input_dim] + [hidden_dim] * (num_layers - 1) + [10]
+        self.layers = nn.ModuleList(nn.Linear(i, o) for i, o in zip(dims[:-1], dims[1:]))
 
         self.activation = nn.GELU()  # Non-saturating, smooth
 
@@ -213,11 +202,16 @@ def demonstrate_gradient_death():
 
     print("\nDeepSigmoidNetwork (WRONG):")
     print("Gradient magnitudes by layer:")
-    for i, layer in enumerate(bad_model.layers):
-        if hasattr(layer, "weight") and layer.weight.grad is not None:
-            grad_norm = layer.weight.grad.norm().item()
-            status = "VANISHING!" if grad_norm < 1e-6 else ""
-            print(f"  Layer {i}: {grad_norm:.2e} {status}")
+    bad_layers = [
+        (i, layer.weight.grad)
+        for i, layer in enumerate(bad_model.layers)
+        if hasattr(layer, "weight") and layer.weight.grad is not None
+    ]
+    # One device->host transfer for all norms instead of one .item() per layer
+    bad_norms = torch.stack([grad.norm() for _, grad in bad_layers]).tolist()
+    for (i, _), grad_norm in zip(bad_layers, bad_norms):
+        status = "VANISHING!" if grad_norm < 1e-6 else ""
+        print(f"  Layer {i}: {grad_norm:.2e} {status}")
 
     # Reset gradients
     x.grad = None
@@ -229,9 +223,11 @@ def demonstrate_gradient_death():
 
     print("\nCorrectResidualNetwork (CORRECT):")
     print("Gradient magnitudes by block:")
-    print(f"  Input projection: {good_model.input_proj.weight.grad.norm().item():.2e}")
-    for i, block in enumerate(good_model.blocks):
-        grad_norm = block[0].weight.grad.norm().item()
+    good_grads = [good_model.input_proj.weight.grad]
+    good_grads.extend(block[0].weight.grad for block in good_model.blocks)
+    input_norm, *block_norms = torch.stack([grad.norm() for grad in good_grads]).tolist()
+    print(f"  Input projection: {input_norm:.2e}")
+    for i, grad_norm in enumerate(block_norms):
         print(f"  Block {i}: {grad_norm:.2e}")
 
 
@@ -8,6 +8,8 @@ Running `demyst leakage examples/ml_data_leakage.py` will detect these issues.
 The #1 error in machine learning: "If test data touches training, your benchmark is a lie."
 """
 
+import functools
+
 import numpy as np
 from sklearn.ensemble import RandomForestClassifier
 from sklearn.feature_selection import SelectKBest, f_classif
@@ -16,12 +18,19 @@ from sklearn.pipeline import Pipeline
 from sklearn.preprocessing import StandardScaler
 
 
+@functools.lru_cache(maxsize=1)
 def load_medical_data():
-    """Simulate medical diagnosis dataset (1000 patients, 20 features)."""
-    np.random.seed(42)
-    X = np.random.randn(1000, 20)
+    """Simulate medical diagnosis dataset (1000 patients, 20 features).
+
+    The dataset is generated once and shared by every pipeline below, so the
+    returned arrays are read-only.
+    """
+    rng = np.random.default_rng(42)
+    X = rng.standard_normal((1000, 20))
     # Target is a function of first two features (with noise)
-    y = (X[:, 0] + X[:, 1] + np.random.randn(1000) * 0.5 > 0).astype(int)
+    y = (X[:, 0] + X[:, 1] + rng.standard_normal(1000) * 0.5 > 0).astype(int)
+    X.setflags(write=False)
+    y.setflags(write=False)
     return X, y
 
 
@@ -48,7 +57,7 @@ def train_with_preprocessing_leakage():
     # Split happens AFTER preprocessing - damage already done
     X_train, X_test, y_train, y_test = train_test_split(X_scaled, y, test_size=0.2, random_state=42)
 
-    model = RandomForestClassifier(n_estimators=10, random_state=42)
+    model = RandomForestClassifier(n_estimators=10, random_state=42, n_jobs=-1)
     model.fit(X_train, y_train)
 
     # This accuracy is INFLATED - scaler saw test data statistics
@@ -81,7 +90,7 @@ def train_with_feature_selection_leakage():
         X_selected, y, test_size=0.2, random_state=42
     )
 
-    model = RandomForestClassifier(n_estimators=10, random_state=42)
+    model = RandomForestClassifier(n_estimators=10, random_state=42, n_jobs=-1)
     model.fit(X_train, y_train)
 
     # Accuracy is misleading - feature selection saw test labels
@@ -105,7 +114,7 @@ def train_on_test_data():
     X, y = load_medical_data()
     X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.2, random_state=42)
 
-    model = RandomForestClassifier(n_estimators=10, random_state=42)
+    model = RandomForestClassifier(n_estimators=10, random_state=42, n_jobs=-1)
 
     # ERROR: Training on test data!
     model.fit(X_test, y_test)  # LeakageHunter flags this line
@@ -141,19 +150,24 @@ def train_correct_pipeline():
     X_train_selected = selector.fit_transform(X_train_scaled, y_train)
     X_test_selected = selector.transform(X_test_scaled)
 
-    model = RandomForestClassifier(n_estimators=10, random_state=42)
+    model = RandomForestClassifier(n_estimators=10, random_state=42, n_jobs=-1)
     model.fit(X_train_selected, y_train)
 
     # This accuracy is VALID - test data was never seen during training
     return model.score(X_test_selected, y_test)
 
 
-def train_with_sklearn_pipeline():
+def train_with_sklearn_pipeline(memory=None):
     """
     BEST PRACTICE: Use sklearn Pipeline to guarantee no leakage.
 
     Pipeline automatically applies fit_transform on train and transform on test
     during cross_val_score, making leakage impossible.
+
+    Pass a ``joblib.Memory`` (or cache directory) as ``memory`` to reuse the
+    fitted scaler/selector when the same folds are evaluated repeatedly, e.g.
+    while tuning the model step. Each fold of a single cross-validation run
+    trains on different rows, so one run on its own gets no cache hits.
     """
     X, y = load_medical_data()
 
@@ -162,12 +176,13 @@ def train_with_sklearn_pipeline():
         [
             ("scaler", StandardScaler()),
             ("selector", SelectKBest(f_classif, k=10)),
-            ("model", RandomForestClassifier(n_estimators=10, random_state=42)),
-        ]
+            ("model", RandomForestClassifier(n_estimators=10, random_state=42, n_jobs=-1)),
+        ],
+        memory=memory,
     )
 
     # cross_val_score handles train/test splitting correctly
-    scores = cross_val_score(pipe, X, y, cv=5)
+    scores = cross_val_score(pipe, X, y, cv=5, n_jobs=-1)
 
     return scores.mean()
 
@@ -6,13 +6,13 @@ def analyze_random_walk(steps=1000):
     Analyze a random walk and calculate statistics.
     This function contains 'computational mirages' that PIPRE should detect.
     """
-    # Generate random walk
-    walk = np.cumsum(np.random.normal(0, 1, steps))
+    # Generate random walk, accumulating in place over the step buffer
+    walk = np.random.default_rng().standard_normal(steps)
+    np.cumsum(walk, out=walk)
 
     # Destructive operations
     mean_pos = np.mean(walk)
     max_pos = np.max(walk)
-    final_pos = walk[-1]
 
     # Premature discretization
     discrete_mean = int(mean_pos)
@@ -17,27 +17,31 @@ import numpy as np
 # and leverage-point relationships.
 
 
-def anscombe_mirage():
-    """All four datasets have mean_y = 7.5, but they're fundamentally different."""
-    # Dataset I: Linear relationship
-    y1 = np.array([8.04, 6.95, 7.58, 8.81, 8.33, 9.96, 7.24, 4.26, 10.84, 4.82, 5.68])
+# Dataset I: Linear relationship
+ANSCOMBE_Y1 = np.array([8.04, 6.95, 7.58, 8.81, 8.33, 9.96, 7.24, 4.26, 10.84, 4.82, 5.68])
+
+# Dataset II: Quadratic relationship (not linear at all!)
+ANSCOMBE_Y2 = np.array([9.14, 8.14, 8.74, 8.77, 9.26, 8.10, 6.13, 3.10, 9.13, 7.26, 4.74])
 
-    # Dataset II: Quadratic relationship (not linear at all!)
-    y2 = np.array([9.14, 8.14, 8.74, 8.77, 9.26, 8.10, 6.13, 3.10, 9.13, 7.26, 4.74])
+# Dataset III: Perfect linear except one outlier at (13, 12.74)
+ANSCOMBE_Y3 = np.array([7.46, 6.77, 12.74, 7.11, 7.81, 8.84, 6.08, 5.39, 8.15, 6.42, 5.73])
 
-    # Dataset III: Perfect linear except one outlier at (13, 12.74)
-    y3 = np.array([7.46, 6.77, 12.74, 7.11, 7.81, 8.84, 6.08, 5.39, 8.15, 6.42, 5.73])
+# Dataset IV: All points at x=8 except one leverage point
+ANSCOMBE_Y4 = np.array([6.58, 5.76, 7.71, 8.84, 8.47, 7.04, 5.25, 12.50, 5.56, 7.91, 6.89])
 
-    # Dataset IV: All points at x=8 except one leverage point
-    y4 = np.array([6.58, 5.76, 7.71, 8.84, 8.47, 7.04, 5.25, 12.50, 5.56, 7.91, 6.89])
+# THE MIRAGE: All means are ~7.5, hiding completely different structures.
+# The datasets are constants, so the means are computed once at import.
+ANSCOMBE_MEANS = (
+    np.mean(ANSCOMBE_Y1),  # 7.50
+    np.mean(ANSCOMBE_Y2),  # 7.50 - but this is a parabola!
+    np.mean(ANSCOMBE_Y3),  # 7.50 - but there's an outlier at 12.74!
+    np.mean(ANSCOMBE_Y4),  # 7.50 - but there's a leverage point!
+)
 
-    # THE MIRAGE: All means are ~7.5, hiding completely different structures
-    mean1 = np.mean(y1)  # 7.50
-    mean2 = np.mean(y2)  # 7.50 - but this is a parabola!
-    mean3 = np.mean(y3)  # 7.50 - but there's an outlier at 12.74!
-    mean4 = np.mean(y4)  # 7.50 - but there's a leverage point!
 
-    return mean1, mean2, mean3, mean4
+def anscombe_mirage():
+    """All four datasets have mean_y = 7.5, but they're fundamentally different."""
+    return ANSCOMBE_MEANS
 
 
 # =============================================================================
@@ -50,15 +54,12 @@ def anscombe_mirage():
 
 def simpsons_paradox_mirage():
     """Aggregated admission rates hide department-level truth."""
-    # Simplified version of the Berkeley data
-    # Department A (easy): 62% admit rate, mostly male applicants
-    dept_a_admits = np.array([1] * 512 + [0] * 313)  # 62% admitted
-
-    # Department F (hard): 6% admit rate, mostly female applicants
-    dept_f_admits = np.array([1] * 22 + [0] * 351)  # 6% admitted
+    # Simplified version of the Berkeley data, built in one np.repeat call:
+    # Department A (easy): 512 of 825 admitted (62%), mostly male applicants
+    # Department F (hard): 22 of 373 admitted (6%), mostly female applicants
 
     # THE MIRAGE: Overall mean hides that success depends on department choice
-    overall_rate = np.mean(np.concatenate([dept_a_admits, dept_f_admits]))
+    overall_rate = np.mean(np.repeat([1, 0, 1, 0], [512, 313, 22, 351]))
 
     # A researcher seeing only overall_rate would miss the confounding variable
     return overall_rate
@@ -74,25 +75,28 @@ def simpsons_paradox_mirage():
 
 def fat_tails_mirage():
     """Average return hides catastrophic tail events."""
-    np.random.seed(42)
-
-    # 10 years of "normal" daily returns (~252 trading days/year)
-    normal_days = np.random.normal(0.0004, 0.01, 2500)  # ~0.04% mean, 1% std
+    rng = np.random.default_rng(42)
 
     # But reality has fat tails - these actually happened:
     black_monday_1987 = -0.226  # -22.6% in ONE DAY
     flash_crash_2010 = -0.0656  # -6.56% intraday
     covid_crash_2020 = -0.1198  # -11.98% single day
+    crashes = (black_monday_1987, flash_crash_2010, covid_crash_2020)
 
-    all_returns = np.concatenate(
-        [normal_days, [black_monday_1987, flash_crash_2010, covid_crash_2020]]
-    )
+    # 10 years of "normal" daily returns (~252 trading days/year), written
+    # straight into a buffer sized for the crash days too (no concatenate copy)
+    all_returns = np.empty(2500 + len(crashes))
+    normal_days = all_returns[:2500]
+    rng.standard_normal(out=normal_days)
+    normal_days *= 0.01  # 1% std
+    normal_days += 0.0004  # ~0.04% mean
+    all_returns[2500:] = crashes
 
     # THE MIRAGE: Mean looks fine, variance looks reasonable
-    avg_return = np.mean(all_returns)  # ~0.03% - seems safe!
+    avg_return = np.mean(all_returns)  # ~-0.02% - just everyday noise!
     volatility = np.std(all_returns)  # Underestimates true risk
 
-    # But the 0.03% average hid the -22.6% Black Monday
+    # But the -0.02% average hid the -22.6% Black Monday
     # Using mean for risk assessment would be catastrophically wrong
 
     return avg_return, volatility
@@ -107,13 +111,9 @@ def fat_tails_mirage():
 
 def outlier_masking_mirage():
     """Two outliers mask each other by distorting mean and std."""
-    # Normal measurements
-    normal_data = np.array([10.2, 10.5, 9.8, 10.1, 10.3, 9.9, 10.0, 10.4])
-
-    # Two equipment malfunctions produced extreme values
-    outliers = np.array([25.0, 28.0])  # Should be obvious outliers
-
-    all_data = np.concatenate([normal_data, outliers])
+    # Normal measurements, followed by two equipment malfunctions that
+    # produced extreme values (25.0 and 28.0 should be obvious outliers)
+    all_data = np.array([10.2, 10.5, 9.8, 10.1, 10.3, 9.9, 10.0, 10.4, 25.0, 28.0])
 
     # THE MIRAGE: Mean is pulled toward outliers
     mean_val = np.mean(all_data)  # ~12.4 instead of ~10.15
@@ -121,7 +121,8 @@ def outlier_masking_mirage():
 
     # Z-score test now FAILS to detect the outliers because
     # the mean and std are already corrupted by them
-    z_scores = (all_data - mean_val) / std_val
+    z_scores = all_data - mean_val
+    z_scores /= std_val
     # The 25.0 and 28.0 values won't exceed z=3 threshold!
 
     return mean_val, std_val, z_scores
@@ -136,25 +137,33 @@ def outlier_masking_mirage():
 
 def climate_extremes_mirage():
     """Average temperature hides deadly extreme events."""
-    np.random.seed(123)
+    rng = np.random.default_rng(123)
+
+    # One year of standard-normal draws per scenario, filled in place
+    baseline_temps = np.empty(365)
+    future_temps = np.empty(365)
+    rng.standard_normal(out=baseline_temps)
+    rng.standard_normal(out=future_temps)
 
     # Historical temperature distribution (baseline)
-    baseline_temps = np.random.normal(20, 5, 365)  # mean 20C, std 5C
+    baseline_temps *= 5  # std 5C
+    baseline_temps += 20  # mean 20C
 
     # Climate change: mean shifts slightly, but extremes shift MORE
     # (variance increases, not just mean)
-    future_temps = np.random.normal(22, 7, 365)  # mean 22C, std 7C
+    future_temps *= 7  # std 7C
+    future_temps += 22  # mean 22C
 
-    # THE MIRAGE: Mean only increased 2C
-    baseline_mean = np.mean(baseline_temps)  # ~20C
-    future_mean = np.mean(future_temps)  # ~22C  (only +2C, seems mild)
+    # THE MIRAGE: Mean rose by under 2C in this sample
+    baseline_mean = np.mean(baseline_temps)  # ~20.2C
+    future_mean = np.mean(future_temps)  # ~21.6C  (only +1.4C, seems mild)
 
     # But extreme heat days (>35C) increased dramatically
-    baseline_extreme_days = np.sum(baseline_temps > 35)  # ~1-2 days
-    future_extreme_days = np.sum(future_temps > 35)  # ~10-15 days
+    baseline_extreme_days = np.sum(baseline_temps > 35)  # none in this sample
+    future_extreme_days = np.sum(future_temps > 35)  # 8 days
 
-    # The +2C average hides a 5-10x increase in deadly heat days
-    return baseline_mean, future_mean
+    # The mild average rise hides deadly heat days appearing out of nowhere
+    return baseline_mean, future_mean, baseline_extreme_days, future_extreme_days
 
 
 # =============================================================================
@@ -169,10 +178,11 @@ def swarm_safety_mirage():
 
     # 999 agents are perfectly aligned (score = 1.0)
     # 1 agent is compromised/rogue (score = 0.0)
-    alignment_scores = np.ones(agent_count)
+    alignment_scores = np.ones(agent_count, dtype=np.float32)
     alignment_scores[-1] = 0.0  # Rogue agent
 
-    # THE MIRAGE: Average looks great!
+    # THE MIRAGE: Average looks great! (Deliberately reduced over the full
+    # array rather than written as (agent_count - 1) / agent_count.)
     mean_alignment = np.mean(alignment_scores)  # 0.999 - seems safe!
 
     # Decision based on mean: "Deploy! Average alignment > 0.99"
@@ -207,9 +217,9 @@ if __name__ == "__main__":
     print(f"Max Z-score: {max(abs(z)):.2f} (< 3, so outliers NOT detected!)\n")
 
     print("=== Climate Extremes ===")
-    base, future = climate_extremes_mirage()
-    print(f"Baseline: {base:.1f}C, Future: {future:.1f}C (+2C average)")
-    print("But extreme heat days increased 5-10x\n")
+    base, future, base_hot, future_hot = climate_extremes_mirage()
+    print(f"Baseline: {base:.1f}C, Future: {future:.1f}C ({future - base:+.1f}C average)")
+    print(f"But days above 35C went from {base_hot} to {future_hot}\n")
 
     print("=== Swarm Safety ===")
     alignment = swarm_safety_mirage()
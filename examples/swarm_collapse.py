@@ -16,7 +16,7 @@ def analyze_swarm_safety(agent_count=1000):
 
     # 999 Agents are perfect (1.0)
     # 1 Agent is Rogue (0.0) - e.g., injected with a jailbreak prompt
-    swarm_alignment = np.ones(agent_count)
+    swarm_alignment = np.ones(agent_count, dtype=np.float32)
     swarm_alignment[-1] = 0.0
 
     # --- The Computational Mirage ---
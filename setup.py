@@ -61,6 +61,7 @@ setup(
     entry_points={
         "console_scripts": [
             "demyst=demyst.cli:main",
+            "demyst-client=demyst.integrations.ci_daemon:client_main",
         ],
     },
 )